@@ -0,0 +1,70 @@
+"""File loaders turning user input (lists or file paths) into lists of strings."""
+
+import os
+from functools import lru_cache
+from typing import List, Tuple, Union
+
+
+def _load_csv_tsv(path: str) -> List[str]:
+    import pandas as pd
+
+    sep = "," if path.lower().endswith(".csv") else "\t"
+    # only the first column is used: skip parsing the rest and NaN detection
+    df = pd.read_csv(
+        path,
+        sep=sep,
+        header=None,
+        usecols=[0],
+        dtype=str,
+        na_filter=False,
+        engine="c",
+    )
+    return [s for s in df.iloc[:, 0] if s]
+
+
+def _load_excel(path: str) -> List[str]:
+    import pandas as pd
+
+    df = pd.read_excel(path, sheet_name=0, header=None, usecols=[0], dtype=str)
+    return df.iloc[:, 0].dropna().tolist()
+
+
+def _load_text(path: str) -> List[str]:
+    # one read + one decode; splitlines() runs in C
+    with open(path, "rb") as file:
+        data = file.read()
+    return [
+        s.strip() for s in data.decode("utf-8").splitlines() if s and not s.isspace()
+    ]
+
+
+_LOADERS = {
+    ".txt": _load_text,
+    ".csv": _load_csv_tsv,
+    ".tsv": _load_csv_tsv,
+    ".xls": _load_excel,
+    ".xlsx": _load_excel,
+}
+
+
+@lru_cache(maxsize=32)
+def _cached_load(path: str, mtime_ns: int, size: int, ext: str) -> Tuple[str, ...]:
+    """Load a file once per (path, mtime, size); edits invalidate the entry."""
+    return tuple(_LOADERS[ext](path))
+
+
+def get_strings(source: Union[List[str], str]) -> List[str]:
+    """
+    Load input strings from a list or a file path.
+    Supports .txt, .csv, .tsv, .xls, .xlsx
+    """
+    if isinstance(source, list):
+        return source
+    if not isinstance(source, str) or not os.path.exists(source):
+        raise ValueError("Provide a list of strings or a valid file path")
+    ext = os.path.splitext(source)[1].lower()
+    if ext not in _LOADERS:
+        raise ValueError(f"Unsupported file type: {ext}")
+    st = os.stat(source)
+    # copy so callers cannot mutate the cached entry
+    return list(_cached_load(source, st.st_mtime_ns, st.st_size, ext))
@@ -0,0 +1,54 @@
+"""Numba-compiled kernels for large similarity matrices (optional dependency).
+
+Importing this module requires numba; callers import it lazily and fall back
+to NumPy when it is unavailable.
+"""
+
+import numba
+import numpy as np
+
+
+@numba.njit(cache=True, parallel=True)
+def alloc_kernel(sim: np.ndarray, threshold: float):
+    """Per-row best column index and whether its score reaches ``threshold``."""
+    n, m = sim.shape
+    out_idx = np.empty(n, dtype=np.int64)
+    mask = np.empty(n, dtype=np.bool_)
+    for i in numba.prange(n):
+        best = 0
+        bv = sim[i, 0]
+        for j in range(1, m):
+            v = sim[i, j]
+            if v > bv:
+                bv = v
+                best = j
+        out_idx[i] = best
+        mask[i] = bv >= threshold
+    return out_idx, mask
+
+
+@numba.njit(cache=True, parallel=True)
+def topk_kernel(sim: np.ndarray, k: int):
+    """Per-row column indices of the ``k`` highest scores, best first."""
+    n, m = sim.shape
+    out = np.empty((n, k), dtype=np.int64)
+    for i in numba.prange(n):
+        vals = np.empty(k, dtype=sim.dtype)
+        idx = out[i]
+        filled = 0
+        for j in range(m):
+            v = sim[i, j]
+            if filled == k and v <= vals[k - 1]:
+                continue
+            # insertion into the sorted k-buffer; ties keep the earlier column
+            pos = filled if filled < k else k - 1
+            while pos > 0 and vals[pos - 1] < v:
+                if pos < k:
+                    vals[pos] = vals[pos - 1]
+                    idx[pos] = idx[pos - 1]
+                pos -= 1
+            vals[pos] = v
+            idx[pos] = j
+            if filled < k:
+                filled += 1
+    return out
@@ -1,7 +1,18 @@
 """High-level orchestrator for running processes."""
 
-from typing import Sequence, Optional, Union, Any
-import pandas as pd
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
 
 from pulse.core.client import CoreClient
 from pulse.auth import _BaseOAuth2Auth
@@ -14,13 +25,72 @@ from pulse.analysis.results import (
     ThemeExtractionResult,
 )
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _wrap_theme_allocation(process: Any, raw: Any, texts: List[str]) -> Any:
+    return ThemeAllocationResult(
+        texts,
+        raw["themes"],
+        raw["assignments"],
+        process.single_label,
+        process.threshold,
+        similarity=raw.get("similarity"),
+        top_k_indices=raw.get("top_k_indices"),
+    )
+
+
+# Result wrapper per original process id: (process, raw, texts) -> result
+_RESULT_WRAPPERS = {
+    "theme_generation": lambda process, raw, texts: ThemeGenerationResult(raw, texts),
+    "sentiment": lambda process, raw, texts: SentimentResult(raw, texts),
+    "theme_allocation": _wrap_theme_allocation,
+    "cluster": lambda process, raw, texts: ClusterResult(raw, texts),
+    "theme_extraction": lambda process, raw, texts: ThemeExtractionResult(
+        raw["extractions"], texts, raw["themes"]
+    ),
+}
+
+
+def _wrap_result(process: Any, raw: Any, texts: List[str]) -> Any:
+    """Wrap a process's raw output in its high-level result (or return it)."""
+    wrap = _RESULT_WRAPPERS.get(getattr(process, "_orig_id", process.id))
+    return raw if wrap is None else wrap(process, raw, texts)
+
+
+def _topological_layers(edges: Dict[str, List[str]]) -> List[List[str]]:
+    """
+    Group DAG nodes into layers (Kahn's algorithm): every node's dependencies
+    sit in earlier layers. Nodes keep their declaration order within a layer.
+    """
+    pending = {node: len(deps) for node, deps in edges.items()}
+    dependents: Dict[str, List[str]] = defaultdict(list)
+    for node, deps in edges.items():
+        for dep in deps:
+            dependents[dep].append(node)
+    layers: List[List[str]] = []
+    layer = [node for node, n in pending.items() if n == 0]
+    while layer:
+        layers.append(layer)
+        ready: Set[str] = set()
+        for node in layer:
+            for child in dependents[node]:
+                pending[child] -= 1
+                if pending[child] == 0:
+                    ready.add(child)
+        layer = [node for node in edges if node in ready]
+    if sum(map(len, layers)) != len(edges):
+        raise RuntimeError("Workflow graph contains a cycle")
+    return layers
+
 
 class Analyzer:
     """High-level orchestrator for Pulse API processes with caching."""
 
     def __init__(
         self,
-        dataset: Union[Sequence[str], pd.Series],
+        dataset: Union[Sequence[str], "pd.Series"],
         processes: Optional[Sequence[Process]] = None,
         *,
         fast: Optional[bool] = None,
@@ -28,7 +98,15 @@ class Analyzer:
         use_cache: bool = True,
         client: Optional[CoreClient] = None,
         auth: Optional[_BaseOAuth2Auth] = None,
+        cache_backend: Optional[MutableMapping[str, Any]] = None,
     ) -> None:
+        """
+        Results are cached on disk under ``cache_dir`` (via diskcache), or in
+        ``cache_backend`` when given: any mapping, e.g. a plain dict for an
+        in-memory cache.
+        """
+        import pandas as pd
+
         # Dataset as pandas Series
         if isinstance(dataset, pd.Series):
             self.dataset = dataset
@@ -43,16 +121,19 @@ class Analyzer:
         # Persistent caching setup
         self.cache_dir = cache_dir
         self.use_cache = use_cache
-        if use_cache and cache_dir:
+        self._cache: Optional[MutableMapping[str, Any]] = None
+        if use_cache and cache_backend is not None:
+            self._cache = cache_backend
+        elif use_cache and cache_dir:
             from diskcache import Cache
 
             self._cache = Cache(cache_dir)
-        else:
-            self._cache = None
         # Core client and auth
         self.client = client or CoreClient(auth=auth)
         # In-memory results
         self.results: dict[str, Any] = {}
+        # Dataset as a list, materialized once per run()
+        self._texts: Optional[list[str]] = None
 
     def _resolve_dependencies(self) -> None:
         """Automatically include any processes that are
@@ -72,47 +153,61 @@ class Analyzer:
             resolved.append(proc)
         self.processes = resolved
 
+    def _dependency_graph(self) -> Dict[str, List[str]]:
+        """Map each process id to the ids of the processes it depends on."""
+        ids: Dict[str, List[str]] = defaultdict(list)
+        for p in self.processes:
+            ids[getattr(p, "_orig_id", p.id)].append(p.id)
+            ids[p.id].append(p.id)
+        edges: Dict[str, List[str]] = {}
+        for p in self.processes:
+            deps: List[str] = []
+            for dep in getattr(p, "depends_on", ()):
+                deps.extend(ids.get(dep, []))
+            theme_src = getattr(p, "_themes_from_alias", None)
+            if theme_src:
+                deps.extend(ids.get(theme_src, []))
+            edges[p.id] = [d for d in dict.fromkeys(deps) if d != p.id]
+        return edges
+
     def run(self) -> "AnalysisResult":
         """Run the configured processes (with simple caching and wrapping results)."""
         results: dict[str, Any] = {}
         texts = self.dataset.tolist()
-        for process in self.processes:
+        # shared with processes (which get this analyzer as ctx) to avoid
+        # each one copying the dataset again
+        self._texts = texts
+
+        def _run_one(process: Process) -> Any:
             key = self._make_cache_key(process) if self._cache is not None else None
             if self.use_cache and self._cache is not None and key in self._cache:
-                wrapped = self._cache[key]
+                return self._cache[key]
+            raw = process.run(self)
+            # Wrap raw response in high-level result based on original process id
+            wrapped = _wrap_result(process, raw, texts)
+            if self.use_cache and self._cache is not None:
+                self._cache[key] = wrapped
+            return wrapped
+
+        # Processes in the same layer do not depend on each other; their
+        # (network-bound) runs overlap on a thread pool
+        by_id = {p.id: p for p in self.processes}
+        for layer in _topological_layers(self._dependency_graph()):
+            procs = [by_id[pid] for pid in layer]
+            if len(procs) == 1:
+                outcomes = [_run_one(procs[0])]
             else:
-                raw = process.run(self)
-                # Wrap raw response in high-level result based on original process id
-                orig_id = getattr(process, "_orig_id", process.id)
-                if orig_id == "theme_generation":
-                    wrapped = ThemeGenerationResult(raw, texts)
-                elif orig_id == "sentiment":
-                    wrapped = SentimentResult(raw, texts)
-                elif orig_id == "theme_allocation":
-                    wrapped = ThemeAllocationResult(
-                        texts,
-                        raw["themes"],
-                        raw["assignments"],
-                        process.single_label,
-                        process.threshold,
-                        similarity=raw.get("similarity"),
-                    )
-                elif orig_id == "cluster":
-                    wrapped = ClusterResult(raw, texts)
-                elif orig_id == "theme_extraction":
-                    wrapped = ThemeExtractionResult(raw, texts, process.themes)
-                else:
-                    wrapped = raw
-                if self.use_cache and self._cache is not None:
-                    self._cache[key] = wrapped
-            results[process.id] = wrapped
+                with ThreadPoolExecutor(max_workers=min(8, len(procs))) as pool:
+                    outcomes = list(pool.map(_run_one, procs))
+            for process, wrapped in zip(procs, outcomes):
+                results[process.id] = wrapped
             # expose partial results for downstream dependencies
             self.results = results
         self.results = results
         return AnalysisResult(results)
 
     def clear_cache(self) -> None:
-        """Clear the on-disk cache, if enabled."""
+        """Clear the result cache, if enabled."""
         if self._cache is not None:
             self._cache.clear()
 
@@ -122,9 +217,10 @@ class Analyzer:
             self.client.close()
         except Exception:
             pass
-        if self._cache:
+        close = getattr(self._cache, "close", None)
+        if close is not None:
             try:
-                self._cache.close()
+                close()
             except Exception:
                 pass
 
@@ -150,8 +246,10 @@ class Analyzer:
                 )
             ),
         )
-        pickled = pickle.dumps(data)
-        return hashlib.sha256(pickled).hexdigest()
+        pickled = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        # keys only need to be collision-resistant, not cryptographic; BLAKE2b
+        # outruns SHA-256 on CPUs without SHA extensions
+        return hashlib.blake2b(pickled, digest_size=16).hexdigest()
 
 
 class AnalysisResult:
@@ -1,7 +1,10 @@
 """Built-in Process primitives for Analyzer."""
 
-from typing import Any, Tuple
-from pulse.core.models import Theme as ThemeModel
+from typing import TYPE_CHECKING, Any, Tuple
+from pulse.core.models import SimilarityResponse, Theme as ThemeModel
+
+if TYPE_CHECKING:
+    import numpy as np
 
 try:
     from typing import Protocol
@@ -9,6 +12,97 @@ except ImportError:
     from typing_extensions import Protocol
 import random
 
+# Below this many rows NumPy beats paying the Numba JIT/dispatch cost.
+_NUMBA_MIN_ROWS = 100_000
+
+
+def _alloc_kernel(
+    sim: "np.ndarray", threshold: float
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Return the best theme index per row and a mask of rows whose best score
+    reaches ``threshold``. Uses a parallel Numba kernel for large matrices
+    when numba is installed, otherwise NumPy.
+    """
+    import numpy as np
+
+    if len(sim) >= _NUMBA_MIN_ROWS:
+        try:
+            from pulse.analysis._kernels import alloc_kernel
+        except ImportError:
+            pass
+        else:
+            return alloc_kernel(np.ascontiguousarray(sim), threshold)
+    best = sim.argmax(axis=1)
+    return best, sim[np.arange(len(sim)), best] >= threshold
+
+
+def _top_k_indices(sim: "np.ndarray", k: int) -> "np.ndarray":
+    """
+    Return the column indices of the ``k`` highest scores in each row, best
+    first. Only the k winners are sorted; the rest of the row is partitioned
+    in linear time (or scanned by a parallel Numba kernel for large matrices
+    when numba is installed).
+    """
+    import numpy as np
+
+    n, m = sim.shape
+    k = min(k, m)
+    if k <= 0:
+        return np.empty((n, 0), dtype=np.intp)
+    if n >= _NUMBA_MIN_ROWS:
+        try:
+            from pulse.analysis._kernels import topk_kernel
+        except ImportError:
+            pass
+        else:
+            return topk_kernel(np.ascontiguousarray(sim), k)
+    if k < m:
+        part = np.argpartition(-sim, k - 1, axis=1)[:, :k]
+    else:
+        part = np.broadcast_to(np.arange(m), (n, m))
+    scores = np.take_along_axis(sim, part, axis=1)
+    order = np.argsort(-scores, axis=1, kind="stable")
+    return np.take_along_axis(part, order, axis=1)
+
+
+def _ctx_texts(ctx: Any) -> list[str]:
+    """
+    Return the context's input texts as a list. Runners materialize it once
+    as ``ctx._texts`` so processes do not each copy the dataset.
+    """
+    texts = getattr(ctx, "_texts", None)
+    if texts is None:
+        texts = list(ctx.dataset)
+    return texts
+
+
+def _dedupe(texts: list[str]) -> Tuple[list[str], "np.ndarray | None"]:
+    """
+    Return the unique texts in first-seen order and, when there were
+    duplicates, the index of each original text into that unique list.
+    """
+    import numpy as np
+
+    index: dict[str, int] = {}
+    inverse = [index.setdefault(t, len(index)) for t in texts]
+    if len(index) == len(texts):
+        return texts, None
+    return list(index), np.asarray(inverse, dtype=np.intp)
+
+
+def _similarity_array(resp: Any, dtype: Any = "float32") -> "np.ndarray":
+    """
+    Return a similarity response as a matrix of ``dtype``. API responses go
+    through ``SimilarityResponse.to_numpy`` (float32 is its cached ``array``);
+    stitched batch results and raw matrices are converted directly.
+    """
+    import numpy as np
+
+    if isinstance(resp, SimilarityResponse):
+        return resp.to_numpy(dtype)
+    return np.asarray(getattr(resp, "similarity", resp), dtype=dtype)
+
 
 class Process(Protocol):
     """Process primitive protocol."""
@@ -39,7 +133,7 @@ class ThemeGeneration:
         self.fast = fast
 
     def run(self, ctx: Any) -> Any:
-        texts = ctx.dataset.tolist()
+        texts = _ctx_texts(ctx)
         fast_flag = self.fast if self.fast is not None else ctx.fast
 
         # sample randomly according to fast flag
@@ -65,7 +159,7 @@ class SentimentProcess:
         self.fast = fast
 
     def run(self, ctx: Any) -> Any:
-        texts = ctx.dataset.tolist()
+        texts = _ctx_texts(ctx)
         fast = self.fast if self.fast is not None else ctx.fast
         return ctx.client.analyze_sentiment(texts, fast=fast)
 
@@ -91,7 +185,7 @@ class ThemeAllocation:
         Allocate themes to texts using similarity to theme labels.
         Returns raw dict including themes, single assignments, and similarity matrix.
         """
-        texts = list(ctx.dataset)
+        texts = _ctx_texts(ctx)
         # Determine raw themes list (static strings or ThemeModel instances)
         if self.themes is not None:
             raw_themes = list(self.themes)
@@ -115,11 +209,19 @@ class ThemeAllocation:
             sim_texts = list(raw_themes)
         fast_flag = ctx.fast
 
+        # cross-similarity returns only the n x m text-vs-theme block, never
+        # the (n + m)^2 matrix of texts + themes; repeated texts are sent once
+        uniq, inverse = _dedupe(texts)
         resp = ctx.client.compare_similarity(
-            set_a=texts, set_b=sim_texts, fast=fast_flag, flatten=False
+            set_a=uniq, set_b=sim_texts, fast=fast_flag, flatten=False
         )
-        # normalize similarity matrix from response or raw matrix
-        similarity = getattr(resp, "similarity", resp)
+        if getattr(resp, "similarity", resp) is None:
+            raise RuntimeError("No similarity matrix available for allocation")
+        # keep the n x m block as one contiguous array from here on; float64,
+        # since these scores are shown to users as returned by the API
+        sim = _similarity_array(resp, "float64")
+        if inverse is not None:
+            sim = sim[inverse]
 
         # If single_label=True, then assign each input to its most similar theme
         # as long as it is over the threshold. If single_label=False, then we
@@ -128,19 +230,21 @@ class ThemeAllocation:
 
         # compute raw assignments: best matching theme index for each text
         assignments: list[int]
-        if similarity is not None:
-            assignments = []
-            for sim_row in similarity:
-                # find index of maximum similarity
-                best_idx = max(range(len(sim_row)), key=lambda i: sim_row[i])
-                assignments.append(best_idx)
+        if len(sim):
+            best_idx, _ = _alloc_kernel(sim, self.threshold)
+            assignments = best_idx.tolist()
         else:
-            raise RuntimeError("No similarity matrix available for allocation")
-        return {
+            assignments = []
+        out = {
             "themes": labels,
             "assignments": assignments,
-            "similarity": similarity,
+            "similarity": sim,
         }
+        if not self.single_label and sim.ndim == 2:
+            # multi-label: keep the best quarter of themes per text, ranked
+            m = sim.shape[1]
+            out["top_k_indices"] = _top_k_indices(sim, min(m, max(1, m // 4)))
+        return out
 
 
 class ThemeExtraction:
@@ -159,8 +263,12 @@ class ThemeExtraction:
         self.version = version
         self.fast = fast
 
-    def run(self, ctx: Any) -> Any:
-        texts = list(ctx.dataset)
+    def run(self, ctx: Any) -> dict[str, Any]:
+        """
+        Extract elements for each theme. Returns raw dict with the extraction
+        response and the themes used, leaving ``self.themes`` untouched.
+        """
+        texts = _ctx_texts(ctx)
         # Determine themes list (static or from another process)
         if self.themes is not None:
             used_themes = list(self.themes)
@@ -168,7 +276,7 @@ class ThemeExtraction:
             alias = getattr(self, "_themes_from_alias", "theme_generation")
             prev = ctx.results.get(alias)
             if prev is not None:
-                used_themes = prev.themes
+                used_themes = list(prev.themes)
             else:
                 # fallback to named source
                 src = getattr(ctx, "sources", {})
@@ -176,12 +284,11 @@ class ThemeExtraction:
                     used_themes = list(src[alias])
                 else:
                     raise RuntimeError(f"{alias} result not available for extraction")
-        self.themes = used_themes
-        self.themes = used_themes
         fast_flag = self.fast if self.fast is not None else ctx.fast
-        return ctx.client.extract_elements(
+        resp = ctx.client.extract_elements(
             inputs=texts, themes=used_themes, version=self.version, fast=fast_flag
         )
+        return {"extractions": resp, "themes": used_themes}
 
 
 class Cluster:
@@ -195,9 +302,16 @@ class Cluster:
 
     def run(self, ctx: Any) -> Any:
         """Compute similarity matrix for clustering (cached for later use)."""
-        texts = list(ctx.dataset)
+        texts = _ctx_texts(ctx)
         fast = self.fast if self.fast is not None else ctx.fast
-        # request full matrix (flatten=False for NxN)
-        resp = ctx.client.compare_similarity(set=texts, fast=fast, flatten=False)
-        # resp.similarity is List[List[float]]
-        return resp.similarity
+        import numpy as np
+
+        # self-similarity over unique texts only; the API sends just the
+        # upper triangle, which is mirrored into a float32 matrix here
+        uniq, inverse = _dedupe(texts)
+        resp = ctx.client.compare_similarity(set=uniq, fast=fast, flatten=True)
+        sim = _similarity_array(resp)
+        if inverse is not None:
+            # scatter unique rows/columns back to every original position
+            sim = sim[np.ix_(inverse, inverse)]
+        return sim
@@ -1,7 +1,6 @@
 """Result helper classes for analysis processes."""
 
-from typing import Any, Optional, Sequence
-import pandas as pd
+from typing import TYPE_CHECKING, Any, Optional, Sequence
 from pulse.core.models import (
     Theme,
     ThemesResponse,
@@ -10,6 +9,10 @@ from pulse.core.models import (
     SentimentResult as SentimentResultModel,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
 
 class ThemeGenerationResult:
     """Results of theme generation with helper methods."""
@@ -17,6 +20,8 @@ class ThemeGenerationResult:
     def __init__(self, response: ThemesResponse, texts: Sequence[str]) -> None:
         self._response = response
         self._texts = list(texts)
+        # to_dataframe() result, built on first call
+        self._df: Optional["pd.DataFrame"] = None
 
     @property
     def themes(self) -> list[Theme]:
@@ -24,23 +29,27 @@ class ThemeGenerationResult:
 
     # legacy assignments removed; assignment is handled by ThemeAllocation process
 
-    def to_dataframe(self) -> pd.DataFrame:
+    def to_dataframe(self) -> "pd.DataFrame":
         """
         Convert theme metadata to a pandas DataFrame with columns:
         [shortLabel, label, description, representative_1, representative_2]
         """
-        data = []
-        for theme in self._response.themes:
-            data.append(
+        import pandas as pd
+
+        if self._df is None:
+            themes = self._response.themes
+            # one list per column; no per-row dicts for pandas to transpose
+            self._df = pd.DataFrame(
                 {
-                    "shortLabel": theme.shortLabel,
-                    "label": theme.label,
-                    "description": theme.description,
-                    "representative_1": theme.representatives[0],
-                    "representative_2": theme.representatives[1],
+                    "shortLabel": [t.shortLabel for t in themes],
+                    "label": [t.label for t in themes],
+                    "description": [t.description for t in themes],
+                    "representative_1": [t.representatives[0] for t in themes],
+                    "representative_2": [t.representatives[1] for t in themes],
                 }
             )
-        return pd.DataFrame(data)
+        # copies are cheap under copy-on-write and keep the cache intact
+        return self._df.copy()
 
 
 class SentimentResult:
@@ -49,26 +58,38 @@ class SentimentResult:
     def __init__(self, response: SentimentResponse, texts: Sequence[str]) -> None:
         self._response = response
         self._texts = list(texts)
+        # to_dataframe() result, built on first call
+        self._df: Optional["pd.DataFrame"] = None
 
     @property
     def sentiments(self) -> list[SentimentResultModel]:
         """List of sentiment labels for each text."""
         return self._response.results
 
-    def to_dataframe(self) -> pd.DataFrame:
+    def to_dataframe(self) -> "pd.DataFrame":
         """Convert results to a pandas DataFrame with text and sentiment."""
-        return pd.DataFrame(
-            {
-                "text": self._texts,
-                "sentiment": [r.sentiment for r in self._response.results],
-                "confidence": [r.confidence for r in self._response.results],
-            }
-        )
+        import pandas as pd
+
+        if self._df is None:
+            self._df = pd.DataFrame(
+                {
+                    "text": self._texts,
+                    "sentiment": [r.sentiment for r in self._response.results],
+                    "confidence": [r.confidence for r in self._response.results],
+                }
+            )
+        return self._df.copy()
 
-    def summary(self) -> pd.Series:
+    def summary(self) -> "pd.Series":
         """Return a summary of sentiment counts as a pandas Series."""
-        series = pd.Series(self._response.sentiments)
-        return series.value_counts()
+        import numpy as np
+        import pandas as pd
+
+        # factorize once, count integer codes; same order as value_counts()
+        codes, labels = pd.factorize(pd.Series(self._response.sentiments))
+        counts = np.bincount(codes, minlength=len(labels))
+        order = np.argsort(-counts, kind="stable")
+        return pd.Series(counts[order], index=labels[order], name="count")
 
     def plot_distribution(self, **kwargs) -> Any:
         """Plot the distribution of sentiment labels using matplotlib."""
@@ -82,6 +103,34 @@ class SentimentResult:
         return ax
 
 
+def _score_matrix(similarity: Any) -> "np.ndarray":
+    """
+    Return ``similarity`` as a 2-D float array. Float arrays keep their dtype;
+    nested lists become float64, so scores keep the API's precision. Ragged or
+    missing rows and missing (None) cells are padded with NaN.
+    """
+    import numpy as np
+
+    if isinstance(similarity, np.ndarray) and similarity.dtype.kind == "f":
+        if similarity.ndim == 2:
+            return np.ascontiguousarray(similarity)
+    try:
+        arr = np.asarray(similarity, dtype=np.float64)
+    except (TypeError, ValueError):
+        # ragged rows
+        arr = None
+    if arr is not None and arr.ndim == 2:
+        return arr
+    if arr is not None and arr.size == 0:
+        # no texts
+        return arr.reshape(len(arr), 0)
+    rows = [() if row is None else row for row in similarity]
+    padded = np.full((len(rows), max(map(len, rows), default=0)), np.nan)
+    for i, row in enumerate(rows):
+        padded[i, : len(row)] = np.asarray(row, dtype=np.float64)
+    return padded
+
+
 class ThemeAllocationResult:
     """Results of theme allocation with helper methods."""
 
@@ -93,67 +142,93 @@ class ThemeAllocationResult:
         single_label: bool = True,
         threshold: float = 0.5,
         similarity: Optional[Sequence[Sequence[float]]] = None,
+        top_k_indices: Any = None,
     ) -> None:
         self._texts = list(texts)
         self._themes = list(themes)
         self._assignments = list(assignments)
         self._single_label = single_label
         self._threshold = threshold
-        # similarity matrix shape (n_texts x n_themes)
-        # use provided similarity matrix; must not be empty for assignment
+        # similarity matrix shape (n_texts x n_themes), nested lists or a 2-D
+        # ndarray; use provided similarity matrix; must not be empty for assignment
         if similarity is None:
             raise RuntimeError(
                 "Similarity matrix is required for ThemeAllocationResult"
             )
-        self._similarity = similarity  # type: Sequence[Sequence[float]]
+        import numpy as np
+
+        # one contiguous float block, shown as-is by to_dataframe/heatmap
+        self._similarity = _score_matrix(similarity)
+        # ranking below runs vectorized on this; missing (NaN) scores rank last
+        missing = np.isnan(self._similarity)
+        if missing.any():
+            self._scores = np.where(missing, -np.inf, self._similarity)
+        else:
+            self._scores = self._similarity
+        # theme labels as an object array for vectorized gathers by index
+        self._themes_arr = np.asarray(self._themes, dtype=object)
+        # optional precomputed ranking (n_texts x k), best theme first
+        self._top_k_indices = top_k_indices
 
-    def assign_single(self, threshold: Optional[float] = None) -> pd.Series:
+    def assign_single(self, threshold: Optional[float] = None) -> "pd.Series":
         """Return a Series mapping each text to its single theme label.
         Applies threshold if provided."""
+        import numpy as np
+        import pandas as pd
+        from pulse.analysis.processes import _alloc_kernel
+
         thr = self._threshold if threshold is None else threshold
-        labels = []
-        for idx, assign in enumerate(self._assignments):
-            # use similarity matrix when available
-            if self._similarity is not None:
-                sim_row = self._similarity[idx]
-                # find best index
-                best_idx = max(range(len(sim_row)), key=lambda i: sim_row[i])
-                best_val = sim_row[best_idx]
-                if best_val >= thr:
-                    labels.append(self._themes[best_idx])
-                else:
-                    labels.append(None)
-            else:
-                # fallback to single assignment
-                labels.append(self._themes[assign])
+        # compare in the scores' dtype so float32 scores equal to the
+        # threshold are not rejected by widening
+        thr = self._scores.dtype.type(thr)
+        sim = self._scores[: len(self._assignments)]
+        if sim.ndim == 2 and sim.shape[1]:
+            best_idx, mask = _alloc_kernel(sim, thr)
+            labels = np.where(mask, self._themes_arr[best_idx], None).tolist()
+        else:
+            labels = [None] * len(sim)
         return pd.Series(labels, index=self._texts, name="theme")
 
-    def assign_multi(self, k: Optional[int] = None) -> pd.DataFrame:
+    def assign_multi(self, k: Optional[int] = None) -> "pd.DataFrame":
         """Return a DataFrame of top-k theme labels per text, based on similarity."""
+        import numpy as np
+        import pandas as pd
+        from pulse.analysis.processes import _top_k_indices
+
         # default k to all themes if not provided
         if k is None:
             k = len(self._themes)
 
+        top = self._top_k_indices
+        if top is None or k > top.shape[1]:
+            top = _top_k_indices(self._scores, k)
+        # ranks that fall on a missing score have no theme
+        empty = None
+        if self._scores is not self._similarity:
+            empty = np.isneginf(np.take_along_axis(self._scores, top, axis=1))
         data = {}
         for j in range(k):
-            col = []
-            for sim_row in self._similarity:
-                # sorted indices by similarity descending
-                sorted_idx = sorted(
-                    range(len(sim_row)), key=lambda i: sim_row[i], reverse=True
-                )
-                if j < len(sorted_idx):
-                    col.append(self._themes[sorted_idx[j]])
-                else:
-                    col.append(None)
+            if j < top.shape[1]:
+                col = self._themes_arr[top[:, j]]
+                if empty is not None:
+                    col = np.where(empty[:, j], None, col)
+                col = col.tolist()
+            else:
+                col = [None] * len(self._texts)
             data[f"theme_{j+1}"] = col
         return pd.DataFrame(data, index=self._texts)
 
     def bar_chart(self, **kwargs) -> Any:
         """Plot a bar chart of theme assignment counts using matplotlib."""
-        counts = pd.Series(self._assignments).value_counts().sort_index()
-        labels = [self._themes[i] for i in counts.index]
-        values = counts.values
+        import numpy as np
+
+        counts = np.bincount(
+            np.asarray(self._assignments, dtype=np.int64), minlength=len(self._themes)
+        )
+        # only themes that were assigned at least once, in theme order
+        present = np.flatnonzero(counts)
+        labels = self._themes_arr[present].tolist()
+        values = counts[present]
         import matplotlib.pyplot as plt
 
         fig, ax = plt.subplots()
@@ -194,17 +269,22 @@ class ThemeAllocationResult:
         ax.set_yticklabels(self._texts)
         return ax
 
-    def to_dataframe(self) -> pd.DataFrame:
+    def to_dataframe(self) -> "pd.DataFrame":
         """Convert results to a DataFrame with text along the y-axis
         and themes along the x-axis. Scores are the similarity values.
         If a cell is empty, it will be null."""
+        import pandas as pd
+
         data = []
         for i, text in enumerate(self._texts):
             for j, theme in enumerate(self._themes):
                 try:
-                    score = self._similarity[i][j]
+                    score = float(self._similarity[i][j])
                 except (IndexError, TypeError):
                     score = None
+                if score != score:
+                    # NaN marks a missing cell
+                    score = None
                 data.append({"text": text, "theme": theme, "score": score})
         return pd.DataFrame(data)
 
@@ -217,8 +297,13 @@ class ClusterResult:
     ) -> None:
         import numpy as np
 
-        self._matrix = np.array(similarity_matrix)
+        # API scores are float32; float64 would double the memory traffic
+        self._matrix = np.asarray(similarity_matrix, dtype=np.float32)
         self._texts = list(texts)
+        # condensed 1 - similarity distances, computed on first dendrogram()
+        self._condensed: Any = None
+        # 2-D PCA coordinates, computed on first plot_scatter()
+        self._coords: Any = None
 
     @property
     def matrix(self) -> Any:
@@ -243,16 +328,28 @@ class ClusterResult:
         labels = model.fit_predict(distance_matrix)
         return labels
 
-    def plot_scatter(self, **kwargs) -> Any:
-        """Plot a 2D scatter of items via PCA reduction of the similarity matrix."""
+    def plot_scatter(self, max_annotations: int = 50, **kwargs) -> Any:
+        """
+        Plot a 2D scatter of items via PCA reduction of the similarity matrix.
+        With more than ``max_annotations`` items, only the points farthest from
+        the centroid are labelled.
+        """
+        import numpy as np
         from sklearn.decomposition import PCA
         import matplotlib.pyplot as plt
 
-        coords = PCA(n_components=2).fit_transform(self._matrix)
+        if self._coords is None:
+            self._coords = PCA(n_components=2).fit_transform(self._matrix)
+        coords = self._coords
         fig, ax = plt.subplots()
         ax.scatter(coords[:, 0], coords[:, 1], **kwargs)
-        for i, txt in enumerate(self._texts):
-            ax.annotate(txt, (coords[i, 0], coords[i, 1]))
+        if len(self._texts) > max_annotations:
+            spread = np.linalg.norm(coords - coords.mean(axis=0), axis=1)
+            annotate = np.sort(np.argsort(spread)[len(spread) - max_annotations :])
+        else:
+            annotate = range(len(self._texts))
+        for i in annotate:
+            ax.annotate(self._texts[i], (coords[i, 0], coords[i, 1]))
         ax.set_xlabel("PC1")
         ax.set_ylabel("PC2")
         return ax
@@ -262,16 +359,23 @@ class ClusterResult:
         Plot a hierarchical clustering dendrogram based on the similarity matrix.
         Converts similarity to distances (1 - similarity) and uses SciPy linkage.
         """
-        from scipy.cluster.hierarchy import linkage, dendrogram as _dendrogram
-        from scipy.spatial.distance import squareform
+        import numpy as np
+        from scipy.cluster.hierarchy import dendrogram as _dendrogram
         import matplotlib.pyplot as _plt
 
-        # Convert similarity to distance matrix
-        dist_matrix = 1 - self._matrix
-        # Condense distance matrix
-        condensed = squareform(dist_matrix, checks=False)
+        try:
+            # drop-in C++ linkage on condensed distances, much faster for Ward
+            from fastcluster import linkage
+        except ImportError:
+            from scipy.cluster.hierarchy import linkage
+
+        if self._condensed is None:
+            # Condensed distances straight from the upper triangle: no N x N
+            # distance matrix; only the N * (N - 1) / 2 vector is float64
+            upper = self._matrix[np.triu_indices(len(self._matrix), k=1)]
+            self._condensed = np.subtract(1.0, upper, dtype=np.float64)
         # Compute linkage (Ward method)
-        Z = linkage(condensed, method=kwargs.pop("method", "ward"))
+        Z = linkage(self._condensed, method=kwargs.pop("method", "ward"))
         # Plot dendrogram
         fig, ax = _plt.subplots()
         _dendrogram(Z, labels=self._texts, ax=ax, **kwargs)
@@ -292,22 +396,44 @@ class ThemeExtractionResult:
         self._response = response
         self._texts = list(texts)
         self._themes = list(themes)
+        # to_dataframe() result, built on first call
+        self._df: Optional["pd.DataFrame"] = None
 
     @property
     def extractions(self) -> list[list[list[str]]]:
         """Nested list of extracted elements per text per theme."""
         return self._response.extractions
 
-    def to_dataframe(self) -> pd.DataFrame:
+    def to_dataframe(self) -> "pd.DataFrame":
         """Convert extraction results to a DataFrame.
         Columns: text, theme, extraction."""
-        rows: list[dict[str, str]] = []
-        for i, text in enumerate(self._texts):
-            for j, theme in enumerate(self._themes):
-                try:
-                    items = self._response.extractions[i][j]
-                except (IndexError, TypeError):
-                    continue
-                for item in items:
-                    rows.append({"text": text, "theme": theme, "extraction": item})
-        return pd.DataFrame(rows)
+        from itertools import chain
+
+        import numpy as np
+        import pandas as pd
+
+        if self._df is not None:
+            return self._df.copy()
+        m = len(self._themes)
+        ext = self._response.extractions
+        # cells beyond the known texts/themes are ignored
+        rows = [row[:m] for row in ext[: len(self._texts)]]
+        if not any(items for row in rows for items in row):
+            # nothing extracted: skip the index arrays entirely
+            self._df = pd.DataFrame(columns=["text", "theme", "extraction"])
+            return self._df.copy()
+        counts = np.zeros((len(rows), m), dtype=np.intp)
+        for i, row in enumerate(rows):
+            counts[i, : len(row)] = [len(items) for items in row]
+        # one entry per extracted item, pointing back at its (text, theme) cell
+        cell_idx = np.repeat(np.arange(counts.size), counts.ravel())
+        texts = np.asarray(self._texts, dtype=object)
+        themes = np.asarray(self._themes, dtype=object)
+        self._df = pd.DataFrame(
+            {
+                "text": texts[cell_idx // max(m, 1)],
+                "theme": themes[cell_idx % max(m, 1)],
+                "extraction": list(chain.from_iterable(chain.from_iterable(rows))),
+            }
+        )
+        return self._df.copy()
@@ -74,6 +74,7 @@ class ClientCredentialsAuth(_BaseOAuth2Auth):
         client_secret: str | None = None,
         token_url: str | None = None,
         audience: str | None = None,
+        organization: str | None = None,
     ) -> None:
         super().__init__(token_url, client_id, audience)
         self.client_secret = (
@@ -81,6 +82,7 @@ class ClientCredentialsAuth(_BaseOAuth2Auth):
             or os.getenv("PULSE_CLIENT_SECRET")
             or _throw_client_secret_error()
         )
+        self.organization = organization
 
     def _refresh_token(self) -> None:
         data: dict[str, str] = {
@@ -89,6 +91,8 @@ class ClientCredentialsAuth(_BaseOAuth2Auth):
             "client_secret": self.client_secret,
             "audience": self.audience,
         }
+        if self.organization:
+            data["organization"] = self.organization
         resp = httpx.post(self.token_url, data=data)
         resp.raise_for_status()
         payload = resp.json()
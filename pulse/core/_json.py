@@ -0,0 +1,24 @@
+"""JSON encoding/decoding for API traffic, using orjson when installed."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speed-up (pip install pulse-sdk[orjson])
+    orjson = None
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    # same encoding httpx applies for ``json=``
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def loads(data: bytes) -> Any:
+    """Decode a JSON response body."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
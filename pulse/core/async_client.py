@@ -0,0 +1,365 @@
+"""AsyncCoreClient for interacting with the Pulse API from asyncio code."""
+
+import asyncio
+import warnings
+from typing import Any, Dict, List, Optional, Type, TypeVar
+
+import httpx
+from pydantic import BaseModel
+
+from pulse.auth import auto_auth
+from pulse.config import DEFAULT_TIMEOUT, PROD_BASE_URL
+from pulse.core.batching import _make_cross_bodies, _make_self_chunks, _stitch_results
+from pulse.core._json import dumps as _dumps, loads as _loads
+from pulse.core.client import _HTTP2_AVAILABLE, _JSON_HEADERS, CoreClient, _batches
+from pulse.core.exceptions import PulseAPIError
+from pulse.core.gzip_client import AsyncGzipClient
+from pulse.core.jobs import Job
+from pulse.core.models import (
+    EmbeddingsResponse,
+    ExtractionsResponse,
+    SentimentResponse,
+    SimilarityResponse,
+    ThemesResponse,
+)
+from pulse.core.retry import AsyncRetryClient
+
+# Concurrent coroutines share one pool, so allow more connections than the
+# synchronous client does.
+_ASYNC_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=50, max_connections=100, keepalive_expiry=60.0
+)
+
+_M = TypeVar("_M", bound=BaseModel)
+
+
+class _AsyncPulseHTTPClient(AsyncRetryClient, AsyncGzipClient):
+    """Async counterpart of the CoreClient's retrying HTTP client."""
+
+
+class AsyncCoreClient:
+    """Asynchronous CoreClient for Pulse API.
+
+    Mirrors :class:`CoreClient`, but every API method is a coroutine, so
+    independent requests can run concurrently with ``asyncio.gather`` over
+    one shared connection pool.
+    """
+
+    def __init__(
+        self,
+        base_url: str = PROD_BASE_URL,
+        timeout: float = DEFAULT_TIMEOUT,
+        client: Optional[httpx.AsyncClient] = None,
+        auth: Optional[httpx.Auth] = None,
+        strict_fast: bool = False,
+        compress_requests: bool = False,
+    ) -> None:
+        """Initialize AsyncCoreClient with optional HTTPX async client
+        (for testing) and optional auth.
+
+        When ``strict_fast`` is True, a fast request that the API answers by
+        enqueuing a job (202) raises PulseAPIError instead of waiting on it.
+
+        When ``compress_requests`` is True, request bodies are sent
+        gzip-compressed; by default they are sent uncompressed."""
+        self.base_url = base_url
+        self.timeout = timeout
+        self.strict_fast = strict_fast
+        if client is not None:
+            # Use provided HTTP client (user is responsible for auth)
+            self.client = client
+        else:
+            self.client = _AsyncPulseHTTPClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                auth=auth or auto_auth(),
+                http2=_HTTP2_AVAILABLE,
+                limits=_ASYNC_POOL_LIMITS,
+                compress=compress_requests,
+            )
+
+    @classmethod
+    def with_client_credentials(
+        cls,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        audience: Optional[str] = None,
+        token_url: Optional[str] = None,
+        base_url: Optional[str] = None,
+        organization: Optional[str] = None,
+    ) -> "AsyncCoreClient":
+        """
+        Construct an AsyncCoreClient using OAuth2 Client Credentials flow.
+
+        Arguments are resolved from the environment and defaults exactly as
+        for :meth:`CoreClient.with_client_credentials`.
+        """
+        return CoreClient.with_client_credentials.__func__(
+            cls,
+            client_id=client_id,
+            client_secret=client_secret,
+            audience=audience,
+            token_url=token_url,
+            base_url=base_url,
+            organization=organization,
+        )
+
+    @classmethod
+    def with_pkce(
+        cls,
+        code: str,
+        code_verifier: str,
+        client_id: Optional[str] = None,
+        redirect_uri: Optional[str] = None,
+        base_url: Optional[str] = None,
+        token_url: Optional[str] = None,
+        scope: Optional[str] = None,
+    ) -> "AsyncCoreClient":
+        """
+        Construct an AsyncCoreClient using OAuth2 Authorization Code flow with
+        PKCE.
+
+        Arguments are resolved from the environment and defaults exactly as
+        for :meth:`CoreClient.with_pkce`.
+        """
+        return CoreClient.with_pkce.__func__(
+            cls,
+            code=code,
+            code_verifier=code_verifier,
+            client_id=client_id,
+            redirect_uri=redirect_uri,
+            base_url=base_url,
+            token_url=token_url,
+            scope=scope,
+        )
+
+    def _fast_job_enqueued(self, response: httpx.Response, stacklevel: int) -> None:
+        """
+        Handle a 202 returned for a fast request; the warning is attributed
+        ``stacklevel`` frames up, as in ``warnings.warn``.
+        """
+        if self.strict_fast:
+            raise PulseAPIError(response)
+        warnings.warn(
+            "fast=True but API enqueued job; waiting",
+            RuntimeWarning,
+            stacklevel=stacklevel,
+        )
+
+    async def _post_json(self, path: str, body: Dict[str, Any]) -> httpx.Response:
+        """POST ``body`` pre-serialized to JSON bytes."""
+        return await self.client.post(path, content=_dumps(body), headers=_JSON_HEADERS)
+
+    async def _request(
+        self,
+        path: str,
+        body: Dict[str, Any],
+        model: Type[_M],
+        fast: bool,
+        timeout: float = 180.0,
+        stacklevel: int = 3,
+    ) -> _M:
+        """
+        POST ``body`` and parse the response, waiting on a job if enqueued.
+        ``stacklevel`` locates the user's call for the fast-enqueued warning,
+        counted as in ``warnings.warn`` from this method.
+        """
+        response = await self._post_json(path, body)
+        status = response.status_code
+        if status == 200:
+            return model.model_validate_json(response.content)
+        if status != 202:
+            raise PulseAPIError(response)
+        if fast:
+            self._fast_job_enqueued(response, stacklevel + 1)
+        job_id = _loads(response.content)["jobId"]
+        job = Job(id=job_id, status="pending")
+        return model.model_validate_json(
+            await job.wait_async(self.client, timeout, raw=True)
+        )
+
+    async def create_embeddings(
+        self, texts: list[str], fast: bool = True, batch_size: Optional[int] = None
+    ) -> EmbeddingsResponse:
+        """
+        Generate dense vector embeddings, sending sub-batches of ``batch_size``
+        concurrently when given.
+        """
+        if not texts:
+            # nothing to embed: skip the request entirely
+            return EmbeddingsResponse.model_construct(embeddings=[], requestId=None)
+        bodies: List[Dict[str, Any]] = []
+        for batch in _batches(texts, batch_size):
+            body: Dict[str, Any] = {"inputs": batch}
+            if fast:
+                body["fast"] = True
+            bodies.append(body)
+        if len(bodies) == 1:
+            return await self._request("/embeddings", body, EmbeddingsResponse, fast)
+        parsed = await asyncio.gather(
+            *(self._request("/embeddings", b, EmbeddingsResponse, fast) for b in bodies)
+        )
+        return EmbeddingsResponse(
+            embeddings=[doc for resp in parsed for doc in resp.embeddings]
+        )
+
+    async def compare_similarity(
+        self,
+        *,
+        set: list[str] | None = None,
+        set_a: list[str] | None = None,
+        set_b: list[str] | None = None,
+        fast: bool = True,
+        flatten: bool = True,
+    ) -> SimilarityResponse:
+        """
+        Compute cosine similarity.
+
+        Must provide exactly one of:
+          - set: list[str]         (self-similarity)
+          - set_a: list[str] and set_b: list[str]   (cross-similarity)
+        """
+        if set is None and (set_a is None or set_b is None):
+            raise ValueError(
+                "You must provide either `set` or both `set_a` and `set_b`."
+            )
+        if set is not None and (set_a is not None or set_b is not None):
+            raise ValueError("Cannot provide both `set` and `set_a`/`set_b`.")
+
+        body: Dict[str, Any] = {}
+        if set is not None:
+            body["set"] = set
+            oversized = len(set) > 200
+        else:
+            body["set_a"] = set_a
+            body["set_b"] = set_b
+            oversized = len(set_a) * len(set_b) > 10_000
+
+        if oversized and not fast:
+            return await self.batch_similarity(
+                set=set, set_a=set_a, set_b=set_b, flatten=flatten
+            )
+
+        if fast:
+            body["fast"] = True
+        body["flatten"] = flatten
+        return await self._request(
+            "/similarity", body, SimilarityResponse, fast, timeout=600
+        )
+
+    async def _run_similarity_job(self, body: Dict[str, Any]) -> Any:
+        response = await self._post_json("/similarity", body)
+        if response.status_code != 202:
+            raise PulseAPIError(response)
+        job = Job(id=_loads(response.content)["jobId"], status="pending")
+        return await job.wait_async(self.client, 600)
+
+    async def batch_similarity(
+        self,
+        *,
+        set: Optional[List[str]] = None,
+        set_a: Optional[List[str]] = None,
+        set_b: Optional[List[str]] = None,
+        flatten: bool = True,
+    ) -> Any:
+        """
+        Batch large similarity requests under the 10k-item limit, running all
+        block jobs concurrently.
+        """
+        if set is not None:
+            chunks = _make_self_chunks(set)
+            bodies: List[Dict[str, Any]] = []
+            k = len(chunks)
+            for i in range(k):
+                for j in range(i, k):
+                    if i == j:
+                        bodies.append({"set": chunks[i], "flatten": flatten})
+                    else:
+                        bodies.append(
+                            {"set_a": chunks[i], "set_b": chunks[j], "flatten": flatten}
+                        )
+        else:
+            bodies = _make_cross_bodies(set_a or [], set_b or [], flatten)
+
+        results = await asyncio.gather(
+            *(self._run_similarity_job(body) for body in bodies)
+        )
+
+        full_a = set or set_a or []
+        full_b = set or set_b or []
+        return _stitch_results(list(results), bodies, full_a, full_b)
+
+    async def generate_themes(
+        self,
+        texts: list[str],
+        min_themes: int = 2,
+        max_themes: int = 50,
+        fast: bool = True,
+    ) -> ThemesResponse:
+        """Cluster texts into latent themes."""
+        if len(texts) < 2:
+            return ThemesResponse.model_construct(themes=[], requestId=None)
+        body: Dict[str, Any] = {"inputs": texts}
+        if min_themes is not None:
+            body["minThemes"] = min_themes
+        if max_themes is not None:
+            body["maxThemes"] = max_themes
+        if fast:
+            body["fast"] = True
+        return await self._request("/themes", body, ThemesResponse, fast)
+
+    async def analyze_sentiment(
+        self, texts: list[str], fast: bool = True
+    ) -> SentimentResponse:
+        """Classify sentiment."""
+        if not texts:
+            # nothing to classify: skip the request entirely
+            return SentimentResponse.model_construct(results=[], requestId=None)
+        body: Dict[str, Any] = {"inputs": texts}
+        if fast:
+            body["fast"] = True
+        return await self._request("/sentiment", body, SentimentResponse, fast)
+
+    async def extract_elements(
+        self,
+        inputs: list[str],
+        themes: list[str],
+        version: Optional[str] = None,
+        fast: bool = True,
+        batch_size: Optional[int] = None,
+    ) -> ExtractionsResponse:
+        """
+        Extract elements matching themes from input strings, sending
+        sub-batches of ``batch_size`` concurrently when given.
+        """
+        if not themes or not inputs:
+            return ExtractionsResponse.model_construct(extractions=[], requestId=None)
+        bodies: List[Dict[str, Any]] = []
+        for batch in _batches(inputs, batch_size):
+            body: Dict[str, Any] = {"inputs": batch, "themes": themes}
+            if version is not None:
+                body["version"] = version
+            if fast:
+                body["fast"] = True
+            bodies.append(body)
+        if len(bodies) == 1:
+            return await self._request("/extractions", body, ExtractionsResponse, fast)
+        parsed = await asyncio.gather(
+            *(
+                self._request("/extractions", b, ExtractionsResponse, fast)
+                for b in bodies
+            )
+        )
+        return ExtractionsResponse(
+            extractions=[e for resp in parsed for e in resp.extractions]
+        )
+
+    async def aclose(self) -> None:
+        """Close underlying HTTP connections."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncCoreClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):  # type: ignore
+        await self.aclose()
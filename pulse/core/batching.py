@@ -1,7 +1,6 @@
 """Batching utilities for similarity requests under Pulse API limits."""
 
 from typing import Any, Dict, List, Tuple
-import numpy as np
 
 # Maximum total items per similarity request
 MAX_ITEMS = 10_000
@@ -47,6 +46,27 @@ def _make_cross_bodies(
     return bodies
 
 
+def _block_matrix(res: Any) -> Any:
+    """
+    Return one block result as a 2-D array. Job results arrive as decoded JSON
+    dicts, possibly in flattened form, so they go through
+    ``SimilarityResponse`` to be expanded; objects with ``matrix`` are used
+    as-is.
+    """
+    import numpy as np
+
+    from pulse.core.models import SimilarityResponse
+
+    if isinstance(res, dict):
+        if "scenario" in res:
+            res = SimilarityResponse.model_validate(res)
+        else:
+            return np.asarray(res["matrix"], dtype=float)
+    if isinstance(res, SimilarityResponse):
+        return res.array
+    return np.asarray(res.matrix, dtype=float)
+
+
 def _stitch_results(
     results: List[Any],
     bodies: List[Dict[str, Any]],
@@ -54,6 +74,8 @@ def _stitch_results(
     full_b: List[str],
 ) -> Any:
     """Stitch block results back into a full similarity matrix."""
+    import numpy as np
+
     A, B = len(full_a), len(full_b)
     matrix = np.zeros((A, B), dtype=float)
 
@@ -68,7 +90,7 @@ def _stitch_results(
             for j in range(i, len(chunks)):
                 coords.append((i, j))
         for res, (i, j) in zip(results, coords):
-            block = res.matrix
+            block = _block_matrix(res)
             r0, r1 = offsets[i], offsets[i + 1]
             c0, c1 = offsets[j], offsets[j + 1]
             matrix[r0:r1, c0:c1] = block
@@ -109,7 +131,7 @@ def _stitch_results(
                     j for j, chunk in enumerate(chunks_b) if chunk is b or chunk == b
                 )
                 res = results[idx]
-                block = res["matrix"]
+                block = _block_matrix(res)
                 r0, r1 = offsets_a[i], offsets_a[i + 1]
                 c0, c1 = offsets_b[j], offsets_b[j + 1]
                 matrix[r0:r1, c0:c1] = block
@@ -131,7 +153,7 @@ def _stitch_results(
             for i, a in enumerate(chunks_a):
                 for j, b in enumerate(chunks_b):
                     res = results[idx]
-                    block = res.matrix
+                    block = _block_matrix(res)
                     r0, r1 = offsets_a[i], offsets_a[i + 1]
                     c0, c1 = offsets_b[j], offsets_b[j + 1]
                     matrix[r0:r1, c0:c1] = block
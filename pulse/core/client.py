@@ -1,23 +1,88 @@
 """CoreClient for interacting with the Pulse API synchronously."""
 
-from typing import Any, Dict, List, Union, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Any, Dict, List, Tuple, Union, Optional
+import os
+import warnings
 import httpx
+from pulse.core._json import dumps as _dumps, loads as _loads
 from pulse.core.gzip_client import GzipClient
+from pulse.core.retry import RetryClient
 from pulse.core.batching import _make_self_chunks, _make_cross_bodies, _stitch_results
 from pulse.auth import ClientCredentialsAuth, AuthorizationCodePKCEAuth, auto_auth
 
 from pulse.config import PROD_BASE_URL, DEFAULT_TIMEOUT
-from pulse.core.jobs import Job
+from pulse.core.jobs import Job, wait_all
 from pulse.core.models import (
     EmbeddingsResponse,
     SimilarityResponse,
     ThemesResponse,
     SentimentResponse,
     ExtractionsResponse,
-    JobSubmissionResponse,
 )
 from pulse.core.exceptions import PulseAPIError
 
+# HTTP/2 multiplexing needs the optional `h2` package (pip install pulse-sdk[http2])
+_HTTP2_AVAILABLE = find_spec("h2") is not None
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Read size when streaming large (embedding/similarity) responses
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Keep warm connections around between calls so repeated requests skip the
+# TCP/TLS handshake; the pool also serves concurrent batch/DAG requests.
+_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=32, max_connections=64, keepalive_expiry=60.0
+)
+
+
+# Bodies whose inputs total fewer characters than this are memoized, so
+# repeated calls with the same texts (hot loops, retries) skip re-encoding
+# while the cache stays small.
+_BODY_CACHE_MAX_CHARS = 64 * 1024
+
+
+@lru_cache(maxsize=128)
+def _dumps_frozen(items: Tuple[Tuple[str, Any], ...]) -> bytes:
+    return _dumps(dict(items))
+
+
+def _encode_body(body: Dict[str, Any]) -> bytes:
+    """Serialize ``body``, reusing the bytes of an identical small body."""
+    inputs = body.get("inputs")
+    if isinstance(inputs, list):
+        try:
+            if sum(len(text) for text in inputs) < _BODY_CACHE_MAX_CHARS:
+                # lists become tuples: hashable, and still encoded as arrays
+                frozen = tuple(
+                    (key, tuple(value) if isinstance(value, list) else value)
+                    for key, value in body.items()
+                )
+                return _dumps_frozen(frozen)
+        except TypeError:
+            # non-string or unhashable inputs: encode without caching
+            pass
+    return _dumps(body)
+
+
+class _PulseHTTPClient(RetryClient, GzipClient):
+    """
+    Client that re-sends throttled or unconnectable calls and, when built with
+    ``compress=True``, gzips request bodies.
+    """
+
+
+def _batches(items: List[str], batch_size: Optional[int]) -> List[List[str]]:
+    """``items`` as one batch, or consecutive chunks of ``batch_size`` if longer."""
+    if batch_size is None or len(items) <= batch_size:
+        return [items]
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer")
+    return [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
+
 
 class CoreClient:
     """Synchronous CoreClient for Pulse API."""
@@ -28,21 +93,165 @@ class CoreClient:
         timeout: float = DEFAULT_TIMEOUT,
         client: Optional[httpx.Client] = None,
         auth: Optional[httpx.Auth] = None,
+        strict_fast: bool = False,
+        warmup: bool = False,
+        compress_requests: bool = False,
     ) -> None:
         """Initialize CoreClient with optional HTTPX client
-        (for testing) and optional auth."""
+        (for testing) and optional auth.
+
+        When ``strict_fast`` is True, a fast request that the API answers by
+        enqueuing a job (202) raises PulseAPIError instead of waiting on it.
+
+        When ``warmup`` is True, a cheap OPTIONS request is sent right away so
+        the first real call finds an open connection (and a fetched token).
+
+        When ``compress_requests`` is True, request bodies are sent
+        gzip-compressed (``Content-Encoding: gzip``); by default they are sent
+        uncompressed. Ignored when ``client`` is given."""
         self.base_url = base_url
         self.timeout = timeout
+        self.strict_fast = strict_fast
         if client is not None:
             # Use provided HTTP client (user is responsible for auth)
             self.client = client
         else:
-            # Create a GzipClient, apply auth for core API calls if provided
-            self.client = GzipClient(
+            # Create a GzipClient, apply auth for core API calls if provided;
+            # it reconnects on connect errors and re-sends throttled (429/503)
+            # calls without replacing httpx's transports, so proxies configured
+            # in the environment keep working
+            self.client = _PulseHTTPClient(
                 base_url=self.base_url,
                 timeout=self.timeout,
                 auth=auth or auto_auth(),
+                http2=_HTTP2_AVAILABLE,
+                limits=_POOL_LIMITS,
+                compress=compress_requests,
             )
+        if warmup:
+            self._warmup()
+
+    def _warmup(self) -> None:
+        """Open a pooled connection ahead of the first call; failures are ignored."""
+        try:
+            self.client.request("OPTIONS", "/")
+        except httpx.HTTPError:
+            # the real request will surface connectivity problems
+            pass
+
+    def _post_json(self, path: str, body: Dict[str, Any]) -> httpx.Response:
+        """POST ``body`` pre-serialized to JSON bytes."""
+        content = _encode_body(body)
+        return self.client.post(path, content=content, headers=_JSON_HEADERS)
+
+    def _post_json_streamed(
+        self, path: str, body: Dict[str, Any], model: Any
+    ) -> Tuple[httpx.Response, Any]:
+        """
+        POST ``body`` and stream the reply. A 200 body is accumulated into one
+        buffer and validated straight from it (no joined copy of the chunks);
+        for any other status the response is read and returned unparsed.
+        """
+        with self.client.stream(
+            "POST", path, content=_encode_body(body), headers=_JSON_HEADERS
+        ) as response:
+            if response.status_code != 200:
+                response.read()
+                return response, None
+            buf = bytearray()
+            for chunk in response.iter_bytes(_STREAM_CHUNK_SIZE):
+                buf += chunk
+        return response, model.model_validate_json(buf)
+
+    def _post_many(
+        self, path: str, bodies: List[Dict[str, Any]], concurrency: int = 8
+    ) -> List[httpx.Response]:
+        """POST each body concurrently over the shared pool; responses in order."""
+        if len(bodies) <= 1 or concurrency <= 1:
+            return [self._post_json(path, body) for body in bodies]
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(bodies))) as pool:
+            return list(pool.map(lambda body: self._post_json(path, body), bodies))
+
+    def _parse_many(
+        self,
+        responses: List[httpx.Response],
+        model: Any,
+        fast: bool,
+        stacklevel: int = 3,
+    ) -> List[Any]:
+        """
+        Validate responses from _post_many, waiting on enqueued jobs together.
+        ``stacklevel`` locates the user's call for the fast-enqueued warning,
+        counted as in ``warnings.warn`` from this method.
+        """
+        parsed: List[Any] = [None] * len(responses)
+        jobs: List[Job] = []
+        job_slots: List[int] = []
+        for i, response in enumerate(responses):
+            status = response.status_code
+            if status == 200:
+                parsed[i] = model.model_validate_json(response.content)
+                continue
+            if status != 202:
+                raise PulseAPIError(response)
+            if fast:
+                self._fast_job_enqueued(response, stacklevel + 1)
+            jobs.append(self._job_from_response(response))
+            job_slots.append(i)
+        if jobs:
+            for i, raw in zip(job_slots, wait_all(jobs, raw=True)):
+                parsed[i] = model.model_validate_json(raw)
+        return parsed
+
+    def _submit(
+        self,
+        path: str,
+        body: Dict[str, Any],
+        model: Any,
+        fast: bool,
+        timeout: float = 180.0,
+        stream: bool = False,
+        stacklevel: int = 3,
+    ) -> Any:
+        """
+        POST ``body`` and validate the reply as ``model``: a 200 is parsed
+        directly, a 202 is waited on as a job, anything else raises.
+        ``stacklevel`` is as for :meth:`_parse_many`.
+        """
+        if stream:
+            response, parsed = self._post_json_streamed(path, body, model)
+            if parsed is not None:
+                return parsed
+        else:
+            response = self._post_json(path, body)
+            if response.status_code == 200:
+                # validate the raw body without building a dict
+                return model.model_validate_json(response.content)
+        if response.status_code != 202:
+            raise PulseAPIError(response)
+        # Async job enqueued during fast sync: wait on it (or raise if strict)
+        if fast:
+            self._fast_job_enqueued(response, stacklevel + 1)
+        raw = self._job_from_response(response).wait_bytes(timeout)
+        return model.model_validate_json(raw)
+
+    def _job_from_response(self, response: httpx.Response) -> Job:
+        """Pending Job for a 202 submission, which carries only the jobId."""
+        job_id = _loads(response.content)["jobId"]
+        return Job(id=job_id, status="pending", _client=self.client)
+
+    def _fast_job_enqueued(self, response: httpx.Response, stacklevel: int) -> None:
+        """
+        Handle a 202 returned for a fast request; the warning is attributed
+        ``stacklevel`` frames up, as in ``warnings.warn``.
+        """
+        if self.strict_fast:
+            raise PulseAPIError(response)
+        warnings.warn(
+            "fast=True but API enqueued job; waiting",
+            RuntimeWarning,
+            stacklevel=stacklevel,
+        )
 
     @classmethod
     def with_client_credentials(
@@ -89,11 +298,6 @@ class CoreClient:
             ValueError: If client_id or client_secret is not provided via arguments
                         or environment variables.
         """
-        # Ensure 'import os' is at the top of the file for os.getenv()
-        import os  # This import is placed here for snippet completeness,
-
-        # ideally it's at the module level.
-
         # Resolve client_id: argument > environment variable
         final_client_id = client_id or os.getenv("PULSE_CLIENT_ID")
         if not final_client_id:
@@ -118,7 +322,6 @@ class CoreClient:
         final_audience = audience or os.getenv("PULSE_AUDIENCE")
 
         # Resolve base_url: argument > environment variable > default (PROD_BASE_URL)
-        # PROD_BASE_URL should be imported from pulse.config at the module level.
         final_base_url = base_url or os.getenv("PULSE_BASE_URL") or PROD_BASE_URL
 
         auth = ClientCredentialsAuth(
@@ -178,11 +381,6 @@ class CoreClient:
             ValueError: If `client_id` or `redirect_uri` is not provided via
                         arguments or environment variables.
         """
-        # Ensure 'import os' is at the top of the file for os.getenv()
-        import os  # This import is placed here for snippet completeness,
-
-        # ideally it's at the module level.
-
         # Resolve client_id: argument > environment variable
         final_client_id = client_id or os.getenv("PULSE_CLIENT_ID")
         if not final_client_id:
@@ -200,7 +398,6 @@ class CoreClient:
             )
 
         # Resolve base_url: argument > environment variable > default (PROD_BASE_URL)
-        # PROD_BASE_URL should be imported from pulse.config at the module level.
         final_base_url = base_url or os.getenv("PULSE_BASE_URL") or PROD_BASE_URL
 
         # Resolve token_url: argument > environment variable > default
@@ -222,9 +419,20 @@ class CoreClient:
         return cls(base_url=final_base_url, auth=auth)
 
     def create_embeddings(
-        self, texts: list[str], fast: bool = True
+        self, texts: list[str], fast: bool = True, batch_size: Optional[int] = None
     ) -> Union[EmbeddingsResponse, Job]:
-        """Generate dense vector embeddings."""
+        """
+        Generate dense vector embeddings.
+
+        With ``batch_size``, longer inputs are split into sub-batches of that
+        size and sent concurrently; embeddings come back in input order.
+        """
+        if not texts:
+            # nothing to embed: skip the request entirely
+            return EmbeddingsResponse.model_construct(embeddings=[], requestId=None)
+        batches = _batches(texts, batch_size)
+        if len(batches) > 1:
+            return self._embed_batches(batches, fast)
 
         # Request body according to OpenAPI spec: inputs
         body: Dict[str, Any] = {"inputs": texts}
@@ -232,27 +440,7 @@ class CoreClient:
             # API expects a JSON boolean for fast
             body["fast"] = True
 
-        response = self.client.post("/embeddings", json=body)
-
-        if response.status_code not in (200, 202):
-            raise PulseAPIError(response)
-
-        data = response.json()
-
-        # If service enqueues an async job during fast sync, treat as error
-        if response.status_code == 202 and fast:
-            raise PulseAPIError(response)
-
-        # Async/job path: wrap and wait for completion (slow sync)
-        if response.status_code == 202:
-            # Async/job path: initial submission returned only jobId
-            submission = JobSubmissionResponse.model_validate(data)
-            job = Job(id=submission.jobId, status="pending")
-            job._client = self.client
-            result = job.wait()
-            return EmbeddingsResponse.model_validate(result)
-        # Synchronous response
-        return EmbeddingsResponse.model_validate(data)
+        return self._submit("/embeddings", body, EmbeddingsResponse, fast, stream=True)
 
     def compare_similarity(
         self,
@@ -305,29 +493,9 @@ class CoreClient:
         # API expects JSON boolean for flatten
         body["flatten"] = flatten
 
-        response = self.client.post("/similarity", json=body)
-
-        # handle error / single-item self-similarity fallback
-        if response.status_code not in (200, 202):
-            raise PulseAPIError(response)
-
-        data = response.json()
-
-        # async enqueued during fast sync is error
-        if response.status_code == 202 and fast:
-            raise PulseAPIError(response)
-
-        # async/job path
-        if response.status_code == 202:
-            # Async/job path: initial submission returned only jobId
-            submission = JobSubmissionResponse.model_validate(data)
-            job = Job(id=submission.jobId, status="pending")
-            job._client = self.client
-            result = job.wait(600)
-            return SimilarityResponse.model_validate(result)
-
-        # sync path
-        return SimilarityResponse.model_validate(data)
+        return self._submit(
+            "/similarity", body, SimilarityResponse, fast, timeout=600, stream=True
+        )
 
     def _submit_batch_similarity_job(self, **kwargs) -> Any:
         body: Dict[str, Any] = {}
@@ -340,17 +508,11 @@ class CoreClient:
         else:
             raise ValueError("Must provide either `set` or both `set_a` and `set_b`.")
 
-        response = self.client.post("/similarity", json=body)
+        response = self._post_json("/similarity", body)
 
         if response.status_code != 202:
             raise PulseAPIError(response)
-        data = response.json()
-        # Async/job path: initial submission returned only jobId
-        submission = JobSubmissionResponse.model_validate(data)
-        job = Job(id=submission.jobId, status="pending")
-        job._client = self.client
-
-        return job
+        return self._job_from_response(response)
 
     def batch_similarity(
         self,
@@ -381,8 +543,10 @@ class CoreClient:
         # submit all jobs
         jobs = [self._submit_batch_similarity_job(**body) for body in bodies]
 
-        # wait for all jobs sequentially to preserve thread safety (e.g., under VCR)
-        results = [job.wait(600) for job in jobs]
+        # poll all jobs together and download their results concurrently; each
+        # block has its own job and result URL, so replayed cassettes match
+        # every concurrent request to a distinct recorded interaction
+        results = wait_all(jobs, 600)
 
         full_a = set or set_a or []
         full_b = set or set_b or []
@@ -400,7 +564,7 @@ class CoreClient:
         # For single-text input, return empty themes and assignments without API call
         if len(texts) < 2:
             # No-op placeholder for single input
-            return ThemesResponse(themes=[], requestId=None)
+            return ThemesResponse.model_construct(themes=[], requestId=None)
         body: Dict[str, Any] = {"inputs": texts}
         # Optionally include theme count bounds
         if min_themes is not None:
@@ -411,90 +575,107 @@ class CoreClient:
         if fast:
             # API expects a JSON boolean for fast
             body["fast"] = True
-        response = self.client.post("/themes", json=body)
-        if response.status_code not in (200, 202):
-            raise PulseAPIError(response)
-        data = response.json()
-        # Async job enqueued during fast sync: error
-        if response.status_code == 202 and fast:
-            raise PulseAPIError(response)
-        if response.status_code == 202:
-            # Async/job path: initial submission returned only jobId
-            submission = JobSubmissionResponse.model_validate(data)
-            job = Job(id=submission.jobId, status="pending")
-            job._client = self.client
-            result = job.wait()
-            return ThemesResponse.model_validate(result)
-        # Synchronous response
-        return ThemesResponse.model_validate(data)
+        return self._submit("/themes", body, ThemesResponse, fast)
 
     def analyze_sentiment(
         self, texts: list[str], fast: bool = True
     ) -> Union[SentimentResponse, Job]:
         """Classify sentiment."""
+        if not texts:
+            # nothing to classify: skip the request entirely
+            return SentimentResponse.model_construct(results=[], requestId=None)
         # Build request body according to OpenAPI spec: input array
         body: Dict[str, Any] = {"inputs": texts}
         if fast:
             # API expects a JSON boolean for fast
             body["fast"] = True
-        response = self.client.post("/sentiment", json=body)
-        # Raise on any error response
-        if response.status_code not in (200, 202):
-            raise PulseAPIError(response)
-        # Parse payload
-        data = response.json()
-        # Async job enqueued during fast sync: error
-        if response.status_code == 202 and fast:
-            raise PulseAPIError(response)
-        # Async job path: wait and parse
-        if response.status_code == 202:
-            # Async/job path: initial submission returned only jobId
-            submission = JobSubmissionResponse.model_validate(data)
-            job = Job(id=submission.jobId, status="pending")
-            job._client = self.client
-            result = job.wait()
-            return SentimentResponse.model_validate(result)
-        # Sync path
-        return SentimentResponse.model_validate(data)
+        return self._submit("/sentiment", body, SentimentResponse, fast)
+
+    def create_embeddings_batched(
+        self, batches: List[List[str]], fast: bool = True, concurrency: int = 8
+    ) -> EmbeddingsResponse:
+        """
+        Embed several independent batches with up to ``concurrency`` requests
+        in flight, returning one response with embeddings in input order.
+        """
+        return self._embed_batches(batches, fast, concurrency)
+
+    def _embed_batches(
+        self, batches: List[List[str]], fast: bool, concurrency: int = 8
+    ) -> EmbeddingsResponse:
+        # shared by create_embeddings and create_embeddings_batched, so the
+        # user's call is always two frames above this one
+        bodies: List[Dict[str, Any]] = []
+        for texts in batches:
+            body: Dict[str, Any] = {"inputs": texts}
+            if fast:
+                body["fast"] = True
+            bodies.append(body)
+        responses = self._post_many("/embeddings", bodies, concurrency)
+        parsed = self._parse_many(responses, EmbeddingsResponse, fast, stacklevel=4)
+        return EmbeddingsResponse(
+            embeddings=[doc for resp in parsed for doc in resp.embeddings]
+        )
+
+    def analyze_sentiment_batched(
+        self, batches: List[List[str]], fast: bool = True, concurrency: int = 8
+    ) -> SentimentResponse:
+        """
+        Classify several independent batches with up to ``concurrency`` requests
+        in flight, returning one response with results in input order.
+        """
+        bodies: List[Dict[str, Any]] = []
+        for texts in batches:
+            body: Dict[str, Any] = {"inputs": texts}
+            if fast:
+                body["fast"] = True
+            bodies.append(body)
+        responses = self._post_many("/sentiment", bodies, concurrency)
+        parsed = self._parse_many(responses, SentimentResponse, fast)
+        return SentimentResponse(results=[r for resp in parsed for r in resp.results])
 
     def close(self) -> None:
         """Close underlying HTTP connection."""
         self.client.close()
 
+    def __enter__(self) -> "CoreClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):  # type: ignore
+        self.close()
+
     def extract_elements(
         self,
         inputs: list[str],
         themes: list[str],
         version: Optional[str] = None,
         fast: bool = True,
+        batch_size: Optional[int] = None,
     ) -> Union[ExtractionsResponse, Job]:
-        """Extract elements matching themes from input strings."""
-        # Skip extraction when no themes provided (e.g., single-text low-level example)
-        if not themes:
-            # No-op placeholder when no themes provided
-            return ExtractionsResponse(extractions=[], requestId=None)
+        """
+        Extract elements matching themes from input strings.
+
+        With ``batch_size``, longer inputs are split into sub-batches of that
+        size and sent concurrently; extractions come back in input order.
+        """
+        # Skip extraction when there is nothing to match (no themes or no inputs)
+        if not themes or not inputs:
+            # No-op placeholder when no request is needed
+            return ExtractionsResponse.model_construct(extractions=[], requestId=None)
         # Build request body according to OpenAPI spec: inputs, themes, optional version
-        body: Dict[str, Any] = {"inputs": inputs, "themes": themes}
-        if version is not None:
-            body["version"] = version
-        if fast:
-            # API expects a JSON boolean for fast
-            body["fast"] = True
-        response = self.client.post("/extractions", json=body)
-        # Raise on any error response
-        if response.status_code not in (200, 202):
-            raise PulseAPIError(response)
-        data = response.json()
-        # Async job enqueued during fast sync: error
-        if response.status_code == 202 and fast:
-            raise PulseAPIError(response)
-        # Async job path: wait and parse
-        if response.status_code == 202:
-            # Async/job path: initial submission returned only jobId
-            submission = JobSubmissionResponse.model_validate(data)
-            job = Job(id=submission.jobId, status="pending")
-            job._client = self.client
-            result = job.wait()
-            return ExtractionsResponse.model_validate(result)
-        # Sync path
-        return ExtractionsResponse.model_validate(data)
+        bodies: List[Dict[str, Any]] = []
+        for batch in _batches(inputs, batch_size):
+            body: Dict[str, Any] = {"inputs": batch, "themes": themes}
+            if version is not None:
+                body["version"] = version
+            if fast:
+                # API expects a JSON boolean for fast
+                body["fast"] = True
+            bodies.append(body)
+        if len(bodies) == 1:
+            return self._submit("/extractions", bodies[0], ExtractionsResponse, fast)
+        responses = self._post_many("/extractions", bodies)
+        parsed = self._parse_many(responses, ExtractionsResponse, fast)
+        return ExtractionsResponse(
+            extractions=[e for resp in parsed for e in resp.extractions]
+        )
@@ -1,14 +1,18 @@
 """Exceptions for Pulse Client API errors."""
 
+from pulse.core._json import loads as _loads
+
 
 class PulseAPIError(Exception):
     """Represents an error returned by the Pulse API."""
 
     def __init__(self, response):
         self.status_code = response.status_code
+        # parse the body once; fall back to its text when it is not JSON
+        content = response.content
         try:
-            detail = response.json()
+            detail = _loads(content)
         except ValueError:
-            detail = response.text
+            detail = content.decode("utf-8", "replace")
         super().__init__(f"Status code: {self.status_code}, Detail: {detail}")
         self.detail = detail
@@ -1,24 +1,76 @@
 """HTTPX client that transparently gzip-compresses request content."""
+import struct
+import threading
+import zlib
+
 import httpx
-import gzip
+
+# Matches gzip.compress(..., compresslevel=9, mtime=0): no flags, zero mtime,
+# XFL=2 (max compression), OS=3 (Unix).
+_GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x02\x03"
+_COMPRESS_LEVEL = 9
+
+_tls = threading.local()
+
+
+def _gzip(data: bytes) -> bytes:
+    """Gzip-compress ``data`` reusing a per-thread, pre-initialized deflate stream."""
+    template = getattr(_tls, "compressobj", None)
+    if template is None:
+        # raw deflate stream (negative wbits); header/trailer are written by hand
+        template = zlib.compressobj(_COMPRESS_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS)
+        _tls.compressobj = template
+    # copy the pristine stream so the template is never consumed
+    compressor = template.copy()
+    body = compressor.compress(data) + compressor.flush(zlib.Z_FINISH)
+    trailer = struct.pack("<II", zlib.crc32(data) & 0xFFFFFFFF, len(data) & 0xFFFFFFFF)
+    return _GZIP_HEADER + body + trailer
+
+
+def _compress_content(kwargs: dict) -> None:
+    """Gzip ``kwargs["content"]`` in place, setting the matching headers."""
+    # Only compress when the user explicitly passed `content`
+    if "content" in kwargs and kwargs["content"]:
+        original = kwargs["content"]
+        # Ensure content is bytes
+        if isinstance(original, str):
+            original = original.encode("utf-8")
+        compressed = _gzip(original)
+
+        # Update the kwargs for the request
+        kwargs["content"] = compressed
+        # copy so a caller's (possibly shared) headers mapping is not mutated
+        headers = kwargs["headers"] = httpx.Headers(kwargs.get("headers"))
+        headers["Content-Encoding"] = "gzip"
+        headers["Content-Length"] = str(len(compressed))
 
 
 class GzipClient(httpx.Client):
-    """HTTPX client that compresses request content with gzip when provided."""
+    """
+    HTTPX client that compresses request content with gzip when provided.
+
+    With ``compress=False`` content is sent as-is, so callers can make
+    compression opt-in.
+    """
+
+    def __init__(self, *args, compress: bool = True, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.compress = compress
 
     def build_request(self, method: str, url: str, **kwargs) -> httpx.Request:
-        # Only compress when the user explicitly passed `content`
-        if "content" in kwargs and kwargs["content"]:
-            original = kwargs["content"]
-            # Ensure content is bytes
-            if isinstance(original, str):
-                original = original.encode("utf-8")
-            compressed = gzip.compress(original)
-
-            # Update the kwargs for the request
-            kwargs["content"] = compressed
-            headers = kwargs.setdefault("headers", {})
-            headers["Content-Encoding"] = "gzip"
-            headers["Content-Length"] = str(len(compressed))
+        if self.compress:
+            _compress_content(kwargs)
+        return super().build_request(method, url, **kwargs)
+
 
+class AsyncGzipClient(httpx.AsyncClient):
+    """Async counterpart of :class:`GzipClient`."""
+
+    def __init__(self, *args, compress: bool = True, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.compress = compress
+
+    def build_request(self, method: str, url: str, **kwargs) -> httpx.Request:
+        if self.compress:
+            _compress_content(kwargs)
         return super().build_request(method, url, **kwargs)
@@ -1,24 +1,116 @@
+import asyncio
+import random
+import threading
 import time
-from typing import Any, Optional, Literal
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Literal, TypeVar
 import httpx
-from pydantic import BaseModel, PrivateAttr, Field, ConfigDict
+from pulse.core._json import loads as _loads
 from pulse.core.exceptions import PulseAPIError
 
+# Indirection so tests can skip polling waits without patching time.sleep.
+_sleep = time.sleep
 
-class Job(BaseModel):
-    """Represents an asynchronous job in Pulse API."""
+# Pause between job status polls: starts short and grows by the backoff factor
+# (plus a little jitter) up to the maximum, in seconds.
+_POLL_INITIAL_INTERVAL = 0.05
+_POLL_MAX_INTERVAL = 2.0
+_POLL_BACKOFF = 1.7
+# Status lookups answered 404/500 (job not visible yet) are retried this many
+# times, this many seconds apart, before the job is failed.
+_STATUS_MAX_RETRIES = 10
+_STATUS_RETRY_DELAY = 10.0
+# Upper bound on status refreshes / result downloads in flight at once
+_MAX_CONCURRENT_FETCHES = 8
 
-    id: str = Field(alias="jobId")
-    status: Literal["pending", "completed", "error", "failed"] = Field(
-        alias="jobStatus"
-    )
-    message: Optional[str] = Field(default=None, alias="message")
-    result_url: Optional[str] = Field(default=None, alias="resultUrl")
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+_JOB_STATUSES = frozenset({"pending", "completed", "error", "failed"})
+
+
+@dataclass(slots=True, init=False)
+class Job:
+    """
+    Represents an asynchronous job in Pulse API.
+
+    Accepts either the field names or the API's payload keys (``jobId``,
+    ``jobStatus``, ``resultUrl``) and rejects unknown statuses with ValueError.
+    ``model_validate``/``model_dump`` mirror the pydantic methods.
+    """
+
+    id: str
+    status: Literal["pending", "completed", "error", "failed"]
+    message: Optional[str]
+    result_url: Optional[str]
+
+    _client: Optional[httpx.Client] = field(repr=False, compare=False)
 
-    _client: httpx.Client = PrivateAttr()
-    model_config = ConfigDict(populate_by_name=True)
+    def __init__(
+        self,
+        id: Optional[str] = None,
+        status: Optional[str] = None,
+        message: Optional[str] = None,
+        result_url: Optional[str] = None,
+        _client: Optional[httpx.Client] = None,
+        *,
+        jobId: Optional[str] = None,
+        jobStatus: Optional[str] = None,
+        resultUrl: Optional[str] = None,
+    ) -> None:
+        job_id = id if id is not None else jobId
+        if job_id is None:
+            raise ValueError("Job requires an id (jobId)")
+        job_status = status if status is not None else jobStatus
+        if job_status not in _JOB_STATUSES:
+            raise ValueError(f"Invalid job status: {job_status!r}")
+        self.id = job_id
+        self.status = job_status  # type: ignore[assignment]
+        self.message = message
+        self.result_url = result_url if result_url is not None else resultUrl
+        self._client = _client
 
-    def refresh(self, max_retries: int = 10, retry_delay: float = 10.0) -> "Job":
+    @classmethod
+    def _from_json(
+        cls, data: Dict[str, Any], client: Optional[httpx.Client] = None
+    ) -> "Job":
+        """Build a Job from a status payload, accepting API or field-name keys."""
+        return cls(
+            id=data.get("jobId") or data.get("id"),
+            status=data.get("jobStatus") or data.get("status"),
+            message=data.get("message"),
+            result_url=data.get("resultUrl") or data.get("result_url"),
+            _client=client,
+        )
+
+    @classmethod
+    def model_validate(cls, data: Dict[str, Any]) -> "Job":
+        """Build a Job from a status payload (API or field-name keys)."""
+        return cls._from_json(data)
+
+    def model_dump(self, by_alias: bool = False) -> Dict[str, Any]:
+        """Return the job's fields as a dict, keyed like the API if ``by_alias``."""
+        if by_alias:
+            return {
+                "jobId": self.id,
+                "jobStatus": self.status,
+                "message": self.message,
+                "resultUrl": self.result_url,
+            }
+        return {
+            "id": self.id,
+            "status": self.status,
+            "message": self.message,
+            "result_url": self.result_url,
+        }
+
+    def refresh(
+        self,
+        max_retries: int = _STATUS_MAX_RETRIES,
+        retry_delay: float = _STATUS_RETRY_DELAY,
+    ) -> "Job":
         """
         Refresh job status via GET /jobs?jobId={id}, retrying on 500 or 404
         up to max_retries times before giving up.
@@ -33,7 +125,7 @@ class Job(BaseModel):
                     f"Job {self.id} not found, retrying ({attempt + 1}/{max_retries})"
                 )
                 if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
+                    _sleep(retry_delay)
                     continue
                 raise PulseAPIError(response)
 
@@ -42,34 +134,317 @@ class Job(BaseModel):
                 raise PulseAPIError(response)
 
             # success!
-            data = response.json()
+            data = _loads(response.content)
             if "jobId" not in data:
                 data["jobId"] = self.id
 
-            job = Job.model_validate(data)
-            job._client = self._client
-            return job
+            return Job._from_json(data, self._client)
 
         # should never get here
         raise PulseAPIError(response)
 
     def wait(self, timeout: float = 180.0) -> Any:
-        start = time.time()
+        return wait_all([self], timeout)[0]
+
+    @classmethod
+    def wait_many(
+        cls, jobs: List["Job"], timeout: float = 180.0, raw: bool = False
+    ) -> List[Any]:
+        """Wait for several jobs together; see :func:`wait_all`."""
+        return wait_all(jobs, timeout, raw)
+
+    def wait_bytes(self, timeout: float = 180.0) -> bytes:
+        """Wait like ``wait`` but return the raw result body, undecoded."""
+        return wait_all([self], timeout, raw=True)[0]
+
+    async def wait_async(
+        self, client: httpx.AsyncClient, timeout: float = 180.0, raw: bool = False
+    ) -> Any:
+        """
+        Await the job's result from asyncio code, polling through ``client``
+        with the same backoff as the shared poller, so many jobs can be awaited
+        concurrently with ``asyncio.gather``. With ``raw`` the result body is
+        returned as bytes instead of decoded.
+        """
+        try:
+            return await asyncio.wait_for(_poll_async(client, self.id, raw), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Job {self.id} did not finish in {timeout} seconds"
+            ) from None
+
+    def _outcome(self, state: "_PendingJob", raw: bool = False) -> Any:
+        """
+        Return the result for a finished poller state, or raise its error.
+        With ``raw`` the result body is returned as bytes instead of decoded.
+        """
+        if state.error is not None:
+            raise state.error
+
+        job = state.job
+        if job.status == "completed":
+            if job.result_url:
+                response = self._client.get(job.result_url)
+                if response.status_code != 200:
+                    raise PulseAPIError(response)
+                return response.content if raw else _loads(response.content)
+            if raw:
+                raise RuntimeError(f"Job {self.id} completed without a result URL")
+            return job
+        error_msg = job.message or ""
+        raise RuntimeError(f"Job {self.id} {job.status}: {error_msg}")
+
+
+async def _poll_async(
+    client: httpx.AsyncClient,
+    job_id: str,
+    raw: bool = False,
+    max_retries: int = _STATUS_MAX_RETRIES,
+    retry_delay: float = _STATUS_RETRY_DELAY,
+) -> Any:
+    """
+    Poll GET /jobs?jobId={id} until the job leaves pending and return its
+    result, retrying on 500 or 404 up to max_retries times like Job.refresh.
+    """
+    misses = 0
+    delay = _POLL_INITIAL_INTERVAL
+    while True:
+        response = await client.get(f"/jobs?jobId={job_id}")
+        if response.status_code in (500, 404):
+            misses += 1
+            if misses >= max_retries:
+                raise PulseAPIError(response)
+            await asyncio.sleep(retry_delay)
+            continue
+        if response.status_code != 200:
+            raise PulseAPIError(response)
+        data = _loads(response.content)
+        data.setdefault("jobId", job_id)
+        job = Job._from_json(data)
+        if job.status != "pending":
+            break
+        await asyncio.sleep(delay + random.uniform(0, delay * 0.1))
+        delay = min(delay * _POLL_BACKOFF, _POLL_MAX_INTERVAL)
+
+    if job.status == "completed":
+        if job.result_url:
+            response = await client.get(job.result_url)
+            if response.status_code != 200:
+                raise PulseAPIError(response)
+            return response.content if raw else _loads(response.content)
+        if raw:
+            raise RuntimeError(f"Job {job_id} completed without a result URL")
+        return job
+    raise RuntimeError(f"Job {job_id} {job.status}: {job.message or ''}")
+
+
+def wait_all(jobs: List[Job], timeout: float = 180.0, raw: bool = False) -> List[Any]:
+    """
+    Wait for several jobs at once and return their results in order.
+
+    All jobs are registered with the shared poller up front, so they are
+    refreshed in the same poll rounds, and finished results are downloaded
+    concurrently. With
+    ``raw`` each result is the undecoded response body (bytes).
+    """
+    poller = JobPoller.instance()
+    states = poller.register_all(jobs)
+    deadline = time.monotonic() + timeout
+    try:
+        for job, state in zip(jobs, states):
+            if not state.event.wait(max(0.0, deadline - time.monotonic())):
+                raise TimeoutError(f"Job {job.id} did not finish in {timeout} seconds")
+    finally:
+        poller.unregister_all(states)
+    # Result downloads are independent, so they run side by side, once per
+    # distinct job. Each goes to its own result URL, which also keeps cassette
+    # replay (VCR) safe: concurrent requests never compete for one recording.
+    unique = list(
+        {id(state): (job, state) for job, state in zip(jobs, states)}.values()
+    )
+    outcomes = poller._map(lambda pair: pair[0]._outcome(pair[1], raw), unique)
+    by_state = {id(state): outcome for (_, state), outcome in zip(unique, outcomes)}
+    return [by_state[id(state)] for state in states]
+
+
+class _PendingJob:
+    """
+    Latest known state of a job registered with the JobPoller, shared by every
+    waiter on that job id.
+    """
+
+    __slots__ = ("job", "event", "error", "waiters", "misses", "retry_at")
+
+    def __init__(self, job: Job) -> None:
+        self.job = job
+        self.event = threading.Event()
+        self.error: Optional[BaseException] = None
+        # number of registrations still waiting on this state
+        self.waiters = 0
+        # consecutive 404/500 status answers, and the poller clock reading
+        # (see JobPoller._clock) at which to ask again
+        self.misses = 0
+        self.retry_at = 0.0
+
+
+class JobPoller:
+    """
+    Process-wide poller refreshing every waiting job from one background thread.
+
+    The Pulse API only exposes per-job status lookups (GET /jobs?jobId=...), so
+    each pending job is still refreshed individually, but all waiters share a
+    single poll loop instead of each running its own, and the lookups of one
+    round are issued concurrently.
+
+    The pause between rounds starts at ``initial_interval`` and grows by
+    ``backoff`` (with a little jitter) up to ``interval``, so short jobs are
+    picked up quickly while long ones are not polled more than needed. Newly
+    registered jobs reset the pause.
+
+    A job whose status lookup answers 404 or 500 is skipped for
+    ``retry_delay`` seconds rather than waited on inline, so it never holds up
+    the other jobs' rounds; it fails after ``max_retries`` such answers. The
+    delay counts the time the poller has paused between rounds, not wall-clock
+    time, and when every waiting job is deferred the poller pauses until the
+    earliest is due instead of running empty rounds.
+    """
+
+    _instance: Optional["JobPoller"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        interval: float = _POLL_MAX_INTERVAL,
+        initial_interval: float = _POLL_INITIAL_INTERVAL,
+        backoff: float = _POLL_BACKOFF,
+        max_retries: int = _STATUS_MAX_RETRIES,
+        retry_delay: float = _STATUS_RETRY_DELAY,
+    ) -> None:
+        self.interval = interval
+        self.initial_interval = initial_interval
+        self.backoff = backoff
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._delay = initial_interval
+        # seconds paused between rounds so far; retry deadlines count on it
+        self._clock = 0.0
+        self._pending: Dict[str, _PendingJob] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        # worker pool for status lookups and result downloads, reused by every
+        # round instead of being rebuilt each time
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @classmethod
+    def instance(cls) -> "JobPoller":
+        """Return the shared poller, creating it on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def register(self, job: Job) -> _PendingJob:
+        """Start polling ``job``; its event is set once it leaves pending."""
+        return self.register_all([job])[0]
+
+    def register_all(self, jobs: List[Job]) -> List[_PendingJob]:
+        """
+        Start polling several jobs, all joining the same poll round. Waiters on
+        a job id that is already registered share its state.
+        """
+        states = []
+        with self._lock:
+            for job in jobs:
+                state = self._pending.get(job.id)
+                if state is None:
+                    state = self._pending[job.id] = _PendingJob(job)
+                state.waiters += 1
+                states.append(state)
+            self._delay = self.initial_interval
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="pulse-job-poller", daemon=True
+                )
+                self._thread.start()
+        return states
+
+    def unregister(self, job_id: str) -> None:
+        """Drop one waiter on the given job; polling stops with the last one."""
+        with self._lock:
+            state = self._pending.get(job_id)
+            if state is not None:
+                self._release(state)
+
+    def unregister_all(self, states: List[_PendingJob]) -> None:
+        """Drop the waiters returned by one ``register_all`` call."""
+        with self._lock:
+            for state in states:
+                self._release(state)
+
+    def _release(self, state: _PendingJob) -> None:
+        # caller holds self._lock
+        state.waiters -= 1
+        if state.waiters <= 0 and self._pending.get(state.job.id) is state:
+            del self._pending[state.job.id]
+
+    def _map(self, fn: Callable[[_T], _R], items: List[_T]) -> List[_R]:
+        """Apply ``fn`` to every item, on the shared pool when there are several."""
+        if len(items) < 2:
+            return [fn(item) for item in items]
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=_MAX_CONCURRENT_FETCHES,
+                    thread_name_prefix="pulse-job-fetch",
+                )
+            executor = self._executor
+        return list(executor.map(fn, items))
+
+    def _refresh(self, state: _PendingJob) -> None:
+        """
+        Look up one waiting job's status once, signalling its waiters when it
+        is done; a 404/500 answer postpones the next lookup instead of
+        sleeping here.
+        """
+        job = state.job
+        try:
+            response = job._client.get(f"/jobs?jobId={job.id}")
+            if response.status_code in (500, 404):
+                state.misses += 1
+                if state.misses >= self.max_retries:
+                    raise PulseAPIError(response)
+                state.retry_at = self._clock + self.retry_delay
+                return
+            if response.status_code != 200:
+                raise PulseAPIError(response)
+            data = _loads(response.content)
+            data.setdefault("jobId", job.id)
+            job = Job._from_json(data, job._client)
+        except Exception as exc:
+            state.error = exc
+            state.event.set()
+            return
+        state.misses = 0
+        state.job = job
+        if job.status != "pending":
+            state.event.set()
+
+    def _run(self) -> None:
         while True:
-            job = self.refresh()
-            if job.status == "pending":
-                pass
-            elif job.status == "completed":
-                if job.result_url:
-                    response = self._client.get(job.result_url)
-                    if response.status_code != 200:
-                        raise PulseAPIError(response)
-                    return response.json()
-                return job
-            else:
-                error_msg = job.message or ""
-                raise RuntimeError(f"Job {self.id} {job.status}: {error_msg}")
-
-            if time.time() - start > timeout:
-                raise TimeoutError(f"Job {self.id} did not finish in {timeout} seconds")
-            time.sleep(2.0)
+            with self._lock:
+                waiting = [s for s in self._pending.values() if not s.event.is_set()]
+                if not waiting:
+                    # nothing left to poll; a later register() starts a new thread
+                    self._thread = None
+                    return
+            self._map(self._refresh, [s for s in waiting if s.retry_at <= self._clock])
+            with self._lock:
+                delay = self._delay
+                self._delay = min(delay * self.backoff, self.interval)
+            pause = delay + random.uniform(0, delay * 0.1)
+            deferred = [s.retry_at for s in waiting if not s.event.is_set()]
+            if deferred:
+                # nothing is due before the earliest deferred lookup
+                pause = max(pause, min(deferred) - self._clock)
+            _sleep(pause)
+            self._clock += pause
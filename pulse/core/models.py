@@ -1,6 +1,11 @@
 """Pydantic models for Pulse API responses."""
-from typing import List, Optional, Literal
-from pydantic import BaseModel, Field, model_validator
+
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, List, Optional, Literal
+from pydantic import BaseModel, Field, SkipValidation, model_validator
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class EmbeddingDocument(BaseModel):
@@ -8,7 +13,10 @@ class EmbeddingDocument(BaseModel):
 
     id: Optional[str] = Field(None, description="Optional document identifier")
     text: str = Field(..., description="Input text for this embedding")
-    vector: List[float] = Field(..., description="Dense vector encoding of the text")
+    # vectors are trusted server output; skip per-element float validation
+    vector: SkipValidation[List[float]] = Field(
+        ..., description="Dense vector encoding of the text"
+    )
 
 
 class EmbeddingsResponse(BaseModel):
@@ -19,6 +27,35 @@ class EmbeddingsResponse(BaseModel):
     )
     requestId: Optional[str] = Field(None, description="Unique request identifier")
 
+    @cached_property
+    def vectors(self) -> "np.ndarray":
+        """
+        All embedding vectors as one contiguous float32 array of shape
+        (n_texts, dim), built on first access and reused afterwards.
+        """
+        import numpy as np
+
+        return self._stack(np.float32)
+
+    def to_numpy(self, dtype: Any = "float32") -> "np.ndarray":
+        """
+        Embedding vectors as an array of ``dtype``, converted straight from the
+        parsed values. ``float16`` halves memory at ~3 significant digits,
+        usually enough for cosine similarity; ``float32`` returns ``vectors``.
+        """
+        import numpy as np
+
+        if np.dtype(dtype) == np.float32:
+            return self.vectors
+        return self._stack(dtype)
+
+    def _stack(self, dtype: Any) -> "np.ndarray":
+        import numpy as np
+
+        if not self.embeddings:
+            return np.empty((0, 0), dtype=dtype)
+        return np.array([doc.vector for doc in self.embeddings], dtype=dtype)
+
 
 class SimilarityResponse(BaseModel):
     """Response model for cosine similarity computations."""
@@ -30,8 +67,11 @@ class SimilarityResponse(BaseModel):
         ..., description="Representation mode: matrix or flattened"
     )
     n: int = Field(..., description="Number of input texts (for self-similarity)")
-    flattened: List[float] = Field(..., description="Flattened similarity values")
-    matrix: Optional[List[List[float]]] = Field(
+    # large numeric payloads: skip per-element validation (trusted server output)
+    flattened: SkipValidation[List[float]] = Field(
+        ..., description="Flattened similarity values"
+    )
+    matrix: SkipValidation[Optional[List[List[float]]]] = Field(
         None, description="Full similarity matrix"
     )
     requestId: Optional[str] = Field(None, description="Unique request identifier")
@@ -44,57 +84,76 @@ class SimilarityResponse(BaseModel):
         """
         if self.matrix:
             return self.matrix
+        if self.scenario not in ("self", "cross"):
+            # unknown scenario
+            return []
+        # fill the matrix with NumPy, then hand back plain float lists
+        import numpy as np
 
-        flat = self.flattened
+        return self._dense(np.float64).tolist()
 
-        if self.scenario == "self":
-            # flattened upper triangle (with or without diagonal)
-            n = self.n
-            total = len(flat)
-            full_tri_len = n * (n + 1) // 2
-            no_diag_tri_len = n * (n - 1) // 2
+    @cached_property
+    def array(self) -> "np.ndarray":
+        """
+        The full similarity matrix (as in ``similarity``) as a float32 NumPy
+        array, built once from ``matrix``/``flattened`` without nested lists.
+        """
+        import numpy as np
+
+        if self.matrix:
+            return np.asarray(self.matrix, dtype=np.float32)
+        if self.scenario not in ("self", "cross"):
+            # unknown scenario
+            return np.empty((0, 0), dtype=np.float32)
+        return self._dense(np.float32)
 
-            # init zero matrix
-            mat = [[0.0] * n for _ in range(n)]
-            idx = 0
+    def to_numpy(self, dtype: Any = "float32") -> "np.ndarray":
+        """
+        The full similarity matrix as an array of ``dtype`` (see
+        ``EmbeddingsResponse.to_numpy``); ``float32`` returns ``array``.
+        """
+        import numpy as np
 
-            if total == full_tri_len:
-                # includes diagonal
-                for i in range(n):
-                    for j in range(i, n):
-                        mat[i][j] = flat[idx]
-                        mat[j][i] = flat[idx]
-                        idx += 1
-            elif total == no_diag_tri_len:
+        if np.dtype(dtype) == np.float32:
+            return self.array
+        if self.matrix:
+            return np.asarray(self.matrix, dtype=dtype)
+        if self.scenario not in ("self", "cross"):
+            # unknown scenario
+            return np.empty((0, 0), dtype=dtype)
+        return self._dense(dtype)
+
+    def _dense(self, dtype: Any) -> "np.ndarray":
+        """Rebuild the full matrix from ``flattened`` as an array of ``dtype``."""
+        import numpy as np
+
+        flat = np.asarray(self.flattened, dtype=dtype)
+        n = self.n
+
+        if self.scenario == "self":
+            # flattened upper triangle (with or without diagonal)
+            if len(flat) == n * (n - 1) // 2:
                 # excludes diagonal: assume diagonal = 1
-                for i in range(n):
-                    mat[i][i] = 1.0
-                for i in range(n):
-                    for j in range(i + 1, n):
-                        mat[i][j] = flat[idx]
-                        mat[j][i] = flat[idx]
-                        idx += 1
+                rows, cols = np.triu_indices(n, k=1)
+                mat = np.ones((n, n), dtype=dtype)
+            elif len(flat) == n * (n + 1) // 2:
+                # includes diagonal
+                rows, cols = np.triu_indices(n)
+                mat = np.empty((n, n), dtype=dtype)
             else:
                 raise ValueError(
-                    f"Unexpected length {total} for self-similarity with n={n}"
+                    f"Unexpected length {len(flat)} for self-similarity with n={n}"
                 )
-
+            mat[rows, cols] = flat
+            mat[cols, rows] = flat
             return mat
 
-        elif self.scenario == "cross":
-            # flattened full cross-matrix of shape (n x m)
-            n = self.n
-            total = len(flat)
-            if n <= 0 or total % n != 0:
-                raise ValueError(
-                    f"Cannot reshape flattened length {total} into {n} rows"
-                )
-            m = total // n
-            return [flat[i * m : (i + 1) * m] for i in range(n)]
-
-        else:
-            # unknown scenario
-            return []
+        # cross: flattened full cross-matrix of shape (n x m)
+        if n <= 0 or len(flat) % n != 0:
+            raise ValueError(
+                f"Cannot reshape flattened length {len(flat)} into {n} rows"
+            )
+        return flat.reshape(n, -1)
 
 
 class Theme(BaseModel):
@@ -124,6 +183,9 @@ class SentimentResult(BaseModel):
     confidence: float = Field(..., description="Confidence score between 0 and 1")
 
 
+_LEGACY_SENTIMENT_LABELS = {"pos": "positive", "neg": "negative", "neu": "neutral"}
+
+
 class SentimentResponse(BaseModel):
     """Response model for sentiment analysis."""
 
@@ -138,10 +200,11 @@ class SentimentResponse(BaseModel):
         Allow legacy 'sentiments' field input by mapping into results list,
         mapping shorthand labels to full values.
         """
-        if "sentiments" in values:
+        # current payloads carry ``results``; only legacy ones need rewriting
+        if isinstance(values, dict) and "sentiments" in values:
             sens = values.pop("sentiments") or []
             # map shorthand to full labels
-            mapping = {"pos": "positive", "neg": "negative", "neu": "neutral"}
+            mapping = _LEGACY_SENTIMENT_LABELS
             mapped = [mapping.get(s, s) for s in sens]
             values["results"] = [{"sentiment": s, "confidence": 0.0} for s in mapped]
         return values
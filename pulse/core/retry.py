@@ -0,0 +1,79 @@
+"""HTTPX clients that retry throttled (429/503) and unconnectable requests."""
+
+import asyncio
+import time
+
+import httpx
+
+_RETRY_STATUSES = frozenset({429, 503})
+# failures raised before the request reached the server, so safe to re-send
+_RETRY_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+_RETRY_BACKOFF = 0.5
+_MAX_RETRY_DELAY = 30.0
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying, honoring a numeric Retry-After header."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), _MAX_RETRY_DELAY)
+        except ValueError:
+            # HTTP-date form: fall back to exponential backoff
+            pass
+    return _backoff(attempt)
+
+
+def _backoff(attempt: int) -> float:
+    return min(_RETRY_BACKOFF * 2**attempt, _MAX_RETRY_DELAY)
+
+
+class RetryClient(httpx.Client):
+    """
+    ``httpx.Client`` that re-sends a request answered with 429 or 503, or that
+    failed to connect, up to ``max_retries`` times.
+
+    Retrying in ``send`` rather than in a custom transport leaves the client's
+    own transports in place, so ``http2``, ``limits`` and proxies from the
+    environment (``HTTPS_PROXY``/``ALL_PROXY``/``NO_PROXY``) still apply.
+    """
+
+    def __init__(self, *args, max_retries: int = 3, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.max_retries = max_retries
+
+    def send(self, request: httpx.Request, **kwargs) -> httpx.Response:
+        for attempt in range(self.max_retries):
+            try:
+                response = super().send(request, **kwargs)
+            except _RETRY_ERRORS:
+                time.sleep(_backoff(attempt))
+                continue
+            if response.status_code not in _RETRY_STATUSES:
+                return response
+            delay = _retry_delay(response, attempt)
+            response.close()
+            time.sleep(delay)
+        return super().send(request, **kwargs)
+
+
+class AsyncRetryClient(httpx.AsyncClient):
+    """Async counterpart of :class:`RetryClient`."""
+
+    def __init__(self, *args, max_retries: int = 3, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.max_retries = max_retries
+
+    async def send(self, request: httpx.Request, **kwargs) -> httpx.Response:
+        for attempt in range(self.max_retries):
+            try:
+                response = await super().send(request, **kwargs)
+            except _RETRY_ERRORS:
+                await asyncio.sleep(_backoff(attempt))
+                continue
+            if response.status_code not in _RETRY_STATUSES:
+                return response
+            delay = _retry_delay(response, attempt)
+            await response.aclose()
+            await asyncio.sleep(delay)
+        return await super().send(request, **kwargs)
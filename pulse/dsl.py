@@ -1,11 +1,15 @@
 """DSL builder for custom workflows in the Pulse client."""
 
-from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+import copy
+from functools import lru_cache
 import os
+import sys
 import json
-from typing import Any, Dict, List
+import threading
+from types import SimpleNamespace
+from typing import Any, Dict, List, Set, Tuple
 
-import pandas as pd
 from pulse.analysis.processes import (
     ThemeGeneration,
     ThemeAllocation,
@@ -13,13 +17,32 @@ from pulse.analysis.processes import (
     SentimentProcess,
     Cluster,
 )
-from pulse.analysis.analyzer import Analyzer
+from pulse.analysis.analyzer import Analyzer, _topological_layers, _wrap_result
 from pulse.core.client import CoreClient
-from pulse.core.models import SentimentResponse as CoreSentimentResponse
+
+try:
+    import yaml
+
+    # prefer the libyaml-backed loader when PyYAML was built with it
+    _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+except ImportError:  # PyYAML is only needed for YAML pipeline files
+    yaml = None
 
 
 # Helpers to flatten and reconstruct nested inputs
 def _flatten_and_shape(x: Any):
+    import numpy as np
+
+    # rectangular inputs (the common case) are traversed by NumPy in C
+    arr = np.asarray(x, dtype=object)
+    flat = arr.ravel().tolist()
+    if not any(isinstance(v, list) for v in flat):
+        return list(arr.shape), flat
+    # ragged input: fall back to recursive traversal
+    return _flatten_and_shape_ragged(x)
+
+
+def _flatten_and_shape_ragged(x: Any):
     shape: List[int] = []
 
     def _get_shape(a: Any, lvl: int = 0):
@@ -45,7 +68,29 @@ def _flatten_and_shape(x: Any):
     return shape, flat
 
 
-def _reconstruct(flat: List[Any], shape: List[int]):
+def _reconstruct(flat: List[Any], shape: List[int], template: Any = None):
+    import numpy as np
+
+    if isinstance(template, list) and all(
+        isinstance(row, list) and not any(isinstance(v, list) for v in row)
+        for row in template
+    ):
+        lens = [len(row) for row in template]
+        if any(n != lens[0] for n in lens):
+            # ragged list of flat rows: slice rows out by running offsets
+            nested: List[Any] = []
+            off = 0
+            for n in lens:
+                nested.append(flat[off : off + n])
+                off += n
+            return nested
+
+    if len(flat) == int(np.prod(shape)):
+        # fill an object array so list-valued items are not expanded
+        arr = np.empty(len(flat), dtype=object)
+        arr[:] = flat
+        return arr.reshape(shape).tolist()
+
     it = iter(flat)
 
     def _build(level: int):
@@ -56,6 +101,58 @@ def _reconstruct(flat: List[Any], shape: List[int]):
     return _build(0)
 
 
+@lru_cache(maxsize=32)
+def _parse_config(
+    file_path: str, mtime_ns: int, size: int
+) -> Tuple[Tuple[str, Dict[str, Any]], ...]:
+    """Parse a pipeline file into (step name, params) pairs."""
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext not in (".yml", ".yaml", ".json"):
+        raise ValueError(f"Unsupported config type: {file_path}")
+    # configs are small: read once and parse from the buffer
+    with open(file_path, "rb") as f:
+        data = f.read()
+    if ext == ".json":
+        config = json.loads(data)
+    else:
+        if yaml is None:
+            raise ImportError("PyYAML is required to parse YAML files")
+        config = yaml.load(data, Loader=_YAML_LOADER)
+    pipeline = config.get("pipeline", [])
+    steps: List[Tuple[str, Dict[str, Any]]] = []
+    for step in pipeline:
+        if not isinstance(step, dict) or len(step) != 1:
+            raise ValueError(f"Invalid pipeline step: {step}")
+        name, params = next(iter(step.items()))
+        steps.append((name, params if params is not None else {}))
+    return tuple(steps)
+
+
+# Steps whose output is exposed as a data source for later steps
+_EXPOSED_STEPS = frozenset({"theme_generation", "sentiment", "theme_extraction"})
+# Steps whose output depends only on their input texts and fast flag
+_FUSABLE_STEPS = frozenset({"sentiment", "cluster"})
+
+
+class _Ctx:
+    """
+    Run context handed to each process. A fresh instance per process, since
+    processes of one layer run concurrently; slots keep it to a small object.
+    """
+
+    __slots__ = ("client", "fast", "dataset", "results", "sources", "_texts")
+
+    def __init__(
+        self, client: Any, fast: bool, dataset: Any, results: Any, sources: Any
+    ) -> None:
+        self.client = client
+        self.fast = fast
+        self.dataset = dataset
+        self.results = results
+        self.sources = sources
+        self._texts: Any = None
+
+
 class Workflow:
     """
     Workflow builder for composing sequences of Processes.
@@ -69,7 +166,14 @@ class Workflow:
         # Internal list of process nodes
         self._processes: List[Any] = []
         # Counters for aliasing duplicate process IDs
-        self._id_counts: Dict[str, int] = defaultdict(int)
+        self._id_counts: Dict[str, int] = {}
+        # Final (possibly aliased) and original ids of registered processes
+        self._process_ids: Set[str] = set()
+        self._orig_ids: Set[str] = set()
+        # Id of the most recently added theme_generation step, if any
+        self._last_theme_generation: str | None = None
+        # Cached graph() adjacency, keyed on the number of registered processes
+        self._graph_cache: Tuple[int, Dict[str, List[str]]] | None = None
 
     def source(self, name: str, data: Any) -> "Workflow":
         """
@@ -79,7 +183,8 @@ class Workflow:
         """
         if name in self._sources:
             raise ValueError(f"Source '{name}' already registered")
-        self._sources[name] = data
+        # interned names and ids compare by identity in the run-time dicts
+        self._sources[sys.intern(name)] = data
         return self
 
     def _add_process(self, process: Any, name: str | None = None) -> None:
@@ -91,15 +196,27 @@ class Workflow:
         setattr(process, "_orig_id", orig_id)
         if name:
             # user-specified alias: must be unique among sources and processes
-            if name in self._sources or name in [p.id for p in self._processes]:
+            if name in self._sources or name in self._process_ids:
                 raise ValueError(f"Process name '{name}' already registered")
-            setattr(process, "id", name)
+            setattr(process, "id", sys.intern(name))
         elif count > 1:
             # auto-aliased numbered id (e.g. sentiment_2)
-            alias = f"{orig_id}_{count}"
+            alias = sys.intern(f"{orig_id}_{count}")
             setattr(process, "id", alias)
         # first occurrence retains original id
         self._processes.append(process)
+        self._process_ids.add(process.id)
+        self._orig_ids.add(orig_id)
+        if orig_id == "theme_generation":
+            self._last_theme_generation = process.id
+        self._graph_cache = None
+
+    def _check_source(self, alias: str, what: str, allow_dataset: bool = True) -> None:
+        """Raise ValueError unless ``alias`` names a source or a prior process."""
+        if allow_dataset and alias == "dataset":
+            return
+        if alias not in self._sources and alias not in self._process_ids:
+            raise ValueError(f"Unknown {what}: '{alias}'")
 
     def theme_generation(
         self,
@@ -122,12 +239,7 @@ class Workflow:
         # determine input source for texts
         alias = source or "dataset"
         # allow text source from named sources or prior process outputs
-        if (
-            alias != "dataset"
-            and alias not in self._sources
-            and alias not in [p.id for p in self._processes]
-        ):
-            raise ValueError(f"Unknown source for theme_generation: '{alias}'")
+        self._check_source(alias, "source for theme_generation")
         setattr(process, "_inputs", [alias])
         return self
 
@@ -146,19 +258,9 @@ class Workflow:
         text_alias = inputs or "dataset"
         if themes is None and themes_from is None:
             # validate text source alias
-            if (
-                text_alias != "dataset"
-                and text_alias not in self._sources
-                and text_alias not in [p.id for p in self._processes]
-            ):
-                raise ValueError(
-                    f"Unknown inputs source for theme_allocation: '{text_alias}'"
-                )
+            self._check_source(text_alias, "inputs source for theme_allocation")
             # inject default theme_generation on the same texts
-            if not any(
-                getattr(p, "_orig_id", p.id) == "theme_generation"
-                for p in self._processes
-            ):
+            if "theme_generation" not in self._orig_ids:
                 self.theme_generation(source=text_alias)
         process = ThemeAllocation(
             themes=themes,
@@ -168,33 +270,18 @@ class Workflow:
         self._add_process(process, name=name)
         # wire text inputs
         inp = text_alias
-        if (
-            inp != "dataset"
-            and inp not in self._sources
-            and inp not in [p.id for p in self._processes]
-        ):
-            raise ValueError(f"Unknown inputs source for theme_allocation: '{inp}'")
+        self._check_source(inp, "inputs source for theme_allocation")
         setattr(process, "_inputs", [inp])
         # wire themes list if dynamic
         if themes is None:
             if themes_from:
                 alias = themes_from
-                if alias not in self._sources and alias not in [
-                    p.id for p in self._processes
-                ]:
-                    raise ValueError(
-                        f"Unknown themes source for theme_allocation: '{alias}'"
-                    )
-            else:
-                # find last theme_generation alias
-                alias = next(
-                    (
-                        p.id
-                        for p in reversed(self._processes[:-1])
-                        if getattr(p, "_orig_id", p.id) == "theme_generation"
-                    ),
-                    None,
+                self._check_source(
+                    alias, "themes source for theme_allocation", allow_dataset=False
                 )
+            else:
+                # last theme_generation alias
+                alias = self._last_theme_generation
             if not alias:
                 raise ValueError("No theme_generation found for theme_allocation")
             setattr(process, "_themes_from_alias", alias)
@@ -219,32 +306,17 @@ class Workflow:
         self._add_process(process, name=name)
         # wire text inputs
         inp = inputs or "dataset"
-        if (
-            inp != "dataset"
-            and inp not in self._sources
-            and inp not in [p.id for p in self._processes]
-        ):
-            raise ValueError(f"Unknown inputs source for theme_extraction: '{inp}'")
+        self._check_source(inp, "inputs source for theme_extraction")
         setattr(process, "_inputs", [inp])
         # wire themes list if dynamic
         if themes is None:
             if themes_from:
                 alias = themes_from
-                if alias not in self._sources and alias not in [
-                    p.id for p in self._processes
-                ]:
-                    raise ValueError(
-                        f"Unknown themes source for theme_extraction: '{alias}'"
-                    )
-            else:
-                alias = next(
-                    (
-                        p.id
-                        for p in reversed(self._processes[:-1])
-                        if getattr(p, "_orig_id", p.id) == "theme_generation"
-                    ),
-                    None,
+                self._check_source(
+                    alias, "themes source for theme_extraction", allow_dataset=False
                 )
+            else:
+                alias = self._last_theme_generation
             if not alias:
                 raise ValueError("No theme_generation found for theme_extraction")
             setattr(process, "_themes_from_alias", alias)
@@ -262,12 +334,7 @@ class Workflow:
         self._add_process(process, name=name)
         # determine input source
         alias = source or "dataset"
-        if (
-            alias != "dataset"
-            and alias not in self._sources
-            and alias not in [p.id for p in self._processes]
-        ):
-            raise ValueError(f"Unknown source for sentiment: '{alias}'")
+        self._check_source(alias, "source for sentiment")
         setattr(process, "_inputs", [alias])
         return self
 
@@ -284,12 +351,7 @@ class Workflow:
         self._add_process(process, name=name)
         # determine input source for clustering
         alias = source or "dataset"
-        if (
-            alias != "dataset"
-            and alias not in self._sources
-            and alias not in [p.id for p in self._processes]
-        ):
-            raise ValueError(f"Unknown source for cluster: '{alias}'")
+        self._check_source(alias, "source for cluster")
         setattr(process, "_inputs", [alias])
         return self
 
@@ -299,31 +361,15 @@ class Workflow:
         Load workflow definition from a JSON or YAML file.
 
         The file must define a top-level 'pipeline' list of single-key mappings.
+        Parsed pipelines are cached per file path, mtime and size.
         """
+        st = os.stat(file_path)
         wf = cls()
-        ext = os.path.splitext(file_path)[1].lower()
-        with open(file_path, "r") as f:
-            if ext in (".yml", ".yaml"):
-                try:
-                    import yaml
-
-                    config = yaml.safe_load(f)
-                except ImportError as e:
-                    raise ImportError("PyYAML is required to parse YAML files") from e
-            elif ext == ".json":
-                config = json.load(f)
-            else:
-                raise ValueError(f"Unsupported config type: {file_path}")
-        pipeline = config.get("pipeline", [])
-        for step in pipeline:
-            if not isinstance(step, dict) or len(step) != 1:
-                raise ValueError(f"Invalid pipeline step: {step}")
-            name, params = next(iter(step.items()))
+        for name, params in _parse_config(file_path, st.st_mtime_ns, st.st_size):
             if not hasattr(wf, name):
                 raise ValueError(f"Unknown pipeline step: {name}")
-            if params is None:
-                params = {}
-            getattr(wf, name)(**params)
+            # copy so builder calls cannot mutate the cached params
+            getattr(wf, name)(**copy.deepcopy(params))
         return wf
 
     def run(self, *args: Any, **kwargs: Any) -> Any:
@@ -352,14 +398,7 @@ class Workflow:
         """
         Internal runner for advanced DSL mode with named sources and DAG execution.
         """
-        # Lazy import to avoid circular dependencies
-        from pulse.analysis.results import (
-            ThemeGenerationResult,
-            SentimentResult,
-            ThemeAllocationResult,
-            ClusterResult,
-            ThemeExtractionResult,
-        )
+        import pandas as pd
 
         # Default client
         client = client or CoreClient()
@@ -367,8 +406,45 @@ class Workflow:
         sources: Dict[str, Any] = dict(self._sources)
         # Results mapping for wrapper objects
         results: Dict[str, Any] = {}
-        # Execute processes in declaration order
-        for process in self._processes:
+        # DSL-level fast flag, used by processes that do not set their own
+        default_fast = True if fast is None else fast
+        # Converted (dataset, texts) per source object, shared by every
+        # process reading the same source
+        prepared: Dict[int, Tuple[Any, Any, List[str]]] = {}
+
+        def _prepare(ds_data: Any) -> Tuple[Any, List[str]]:
+            entry = prepared.get(id(ds_data))
+            if entry is None or entry[0] is not ds_data:
+                # Sequences and Series are handed over as-is; processes only
+                # iterate them, so wrapping them in a Series is wasted work
+                if isinstance(ds_data, (list, tuple, pd.Series)):
+                    dataset = ds_data
+                else:
+                    dataset = pd.Series(ds_data)
+                # materialize the texts once for the processes and wrappers
+                texts = ds_data if isinstance(ds_data, list) else list(dataset)
+                entry = prepared[id(ds_data)] = (ds_data, dataset, texts)
+            return entry[1], entry[2]
+
+        # Identical parameter-free steps on the same source share one run
+        fused: Dict[Tuple[str, str, bool], Future] = {}
+        fused_lock = threading.Lock()
+
+        def _run_fused(key: Tuple[str, str, bool], process: Any, ctx: _Ctx) -> Any:
+            with fused_lock:
+                future = fused.get(key)
+                owner = future is None
+                if owner:
+                    future = fused[key] = Future()
+            if owner:
+                try:
+                    future.set_result(process.run(ctx))
+                except Exception as exc:
+                    future.set_exception(exc)
+            return future.result()
+
+        def _execute(process: Any) -> Tuple[Any, Dict[str, Any]]:
+            """Run one process; return its wrapped result and new sources."""
             # Validate and get dataset input
             inputs = getattr(process, "_inputs", ["dataset"])
             if not inputs:
@@ -381,105 +457,123 @@ class Workflow:
             ds_data = sources[ds_alias]
 
             # Build context
-            class Ctx:
-                pass
-
-            ctx = Ctx()
-            ctx.client = client
-            # fast flag per process, fallback to DSL-level
-            ctx.fast = (
-                process.fast
-                if getattr(process, "fast", None) is not None
-                else (fast if fast is not None else True)
+            proc_fast = getattr(process, "fast", None)
+            ctx = _Ctx(
+                client=client,
+                # fast flag per process, fallback to DSL-level
+                fast=default_fast if proc_fast is None else proc_fast,
+                dataset=None,
+                results=results,
+                # expose named and generated sources to processes
+                sources=sources,
             )
-            # Dataset as pandas Series
-            if isinstance(ds_data, pd.Series):
-                ctx.dataset = ds_data
-            else:
-                ctx.dataset = pd.Series(ds_data)
-            ctx.results = results
-            # expose named and generated sources to processes
-            ctx.sources = sources
-            # Run and wrap result
-            raw = process.run(ctx)
+            ctx.dataset, ctx._texts = _prepare(ds_data)
             orig = getattr(process, "_orig_id", process.id)
+            # Nested sentiment input: flatten once and run on the flat texts
+            nested_shape = None
+            if (
+                orig == "sentiment"
+                and isinstance(ds_data, list)
+                and any(isinstance(v, list) for v in ds_data)
+            ):
+                nested_shape, flat_texts = _flatten_and_shape(ds_data)
+                ctx.dataset = ctx._texts = flat_texts
+            # Run and wrap result; sources are only written by the caller
+            if orig in _FUSABLE_STEPS:
+                raw = _run_fused((orig, ds_alias, ctx.fast), process, ctx)
+            else:
+                raw = process.run(ctx)
+            wrapped = _wrap_result(process, raw, ctx._texts)
+            exposed: Dict[str, Any] = {}
             if orig == "theme_generation":
-                wrapped = ThemeGenerationResult(raw, ctx.dataset.tolist())
                 # make themes available as data source
-                sources[process.id] = wrapped.themes
+                exposed[process.id] = wrapped.themes
             elif orig == "sentiment":
-                # Support nested input: flatten, call, reconstruct
-                data_in = ds_data
-                try:
-                    shape, flat_texts = _flatten_and_shape(data_in)
-                    # call sentiment on flat list
-                    ctx.dataset = pd.Series(flat_texts)
-                    flat_raw = process.run(ctx)
-                    flat_sents = flat_raw.sentiments
-                    nested = _reconstruct(flat_sents, shape)
-                    # wrap nested sentiments
-                    raw2 = CoreSentimentResponse(sentiments=nested)
-                    wrapped = SentimentResult(raw2, flat_texts)
-                    sources[process.id] = nested
-                except Exception:
-                    # fallback to default behavior
-                    wrapped = SentimentResult(raw, ctx.dataset.tolist())
-                    sources[process.id] = wrapped.sentiments
-            elif orig == "theme_allocation":
-                wrapped = ThemeAllocationResult(
-                    ctx.dataset.tolist(),
-                    raw["themes"],
-                    raw["assignments"],
-                    process.single_label,
-                    process.threshold,
-                    similarity=raw.get("similarity"),
-                )
-            elif orig == "cluster":
-                wrapped = ClusterResult(raw, ctx.dataset.tolist())
+                if nested_shape is not None:
+                    # expose labels in the same nested shape as the input
+                    try:
+                        exposed[process.id] = _reconstruct(
+                            raw.sentiments, nested_shape, template=ds_data
+                        )
+                    except StopIteration:
+                        # ragged input: keep labels flat
+                        exposed[process.id] = raw.sentiments
+                else:
+                    exposed[process.id] = raw.sentiments
             elif orig == "theme_extraction":
-                wrapped = ThemeExtractionResult(
-                    raw, ctx.dataset.tolist(), process.themes
-                )
                 # make extracted elements available as data source
-                sources[process.id] = wrapped.extractions
+                exposed[process.id] = wrapped.extractions
+            return wrapped, exposed
+
+        # Execute the DAG layer by layer; processes within a layer have no
+        # data dependency on each other, so their API calls run concurrently
+        by_id = {p.id: p for p in self._processes}
+        layers = _topological_layers(self._edges())
+        # Reject inputs no source or step provides before any API call is made
+        available = set(sources)
+        available.update(
+            p.id
+            for p in self._processes
+            if getattr(p, "_orig_id", p.id) in _EXPOSED_STEPS
+        )
+        for p in self._processes:
+            inputs = getattr(p, "_inputs", ["dataset"])
+            if inputs and inputs[0] not in available:
+                raise ValueError(f"Source '{inputs[0]}' not found for process '{p.id}'")
+        for layer in layers:
+            procs = [by_id[pid] for pid in layer]
+            if len(procs) == 1:
+                outcomes = [_execute(procs[0])]
             else:
-                wrapped = raw
-            # Store for downstream
-            results[process.id] = wrapped
+                with ThreadPoolExecutor(max_workers=min(8, len(procs))) as pool:
+                    outcomes = list(pool.map(_execute, procs))
+            # Store for downstream, in declaration order
+            for process, (wrapped, exposed) in zip(procs, outcomes):
+                sources.update(exposed)
+                results[process.id] = wrapped
         # Return a results container
-        return type("DSLResult", (), results)()
+        return SimpleNamespace(**results)
 
     def graph(self) -> Dict[str, List[str]]:
         """
         Return a simple adjacency list representing the workflow DAG.
         """
-        edges: Dict[str, List[str]] = {}
-        id_to_aliases: Dict[str, List[str]] = defaultdict(list)
-        for p in self._processes:
-            orig = getattr(p, "_orig_id", p.id)
-            id_to_aliases[orig].append(p.id)
+        return {alias: list(deps) for alias, deps in self._edges().items()}
+
+    def _edges(self) -> Dict[str, List[str]]:
+        """Cached adjacency shared by graph() and run(); callers must not mutate."""
+        cache = self._graph_cache
+        if cache is None or cache[0] != len(self._processes):
+            cache = (len(self._processes), self._build_graph())
+            self._graph_cache = cache
+        return cache[1]
+
+    def _build_graph(self) -> Dict[str, List[str]]:
+        # read each process's wiring attributes once
+        nodes = [
+            (
+                p.id,
+                getattr(p, "_orig_id", p.id),
+                getattr(p, "depends_on", ()),
+                getattr(p, "_inputs", ()),
+                getattr(p, "_themes_from_alias", None),
+            )
+            for p in self._processes
+        ]
+        id_to_aliases: Dict[str, List[str]] = {}
+        for alias, orig, _, _, _ in nodes:
+            id_to_aliases.setdefault(orig, []).append(alias)
         # Build adjacency: include both declared depends_on and wired inputs
-        proc_ids = [p.id for p in self._processes]
-        for p in self._processes:
-            alias = p.id
-            # collect static dependencies based on orig_id.depends_on
-            deps: List[str] = []
-            for dep in getattr(p, "depends_on", ()):  # type: ignore[attr-defined]
-                deps.extend(id_to_aliases.get(dep, []))
-            # collect dynamic inputs from DSL wiring (skip 'dataset')
-            for inp in getattr(p, "_inputs", []):
-                if inp != "dataset" and inp in proc_ids:
-                    deps.append(inp)
-            # collect theme-source wiring
-            theme_src = getattr(p, "_themes_from_alias", None)
+        proc_ids = self._process_ids
+        edges: Dict[str, List[str]] = {}
+        for alias, _, depends_on, inputs, theme_src in nodes:
+            # static dependencies based on orig_id.depends_on
+            deps = [a for dep in depends_on for a in id_to_aliases.get(dep, ())]
+            # dynamic inputs from DSL wiring (skip 'dataset')
+            deps += [i for i in inputs if i != "dataset" and i in proc_ids]
+            # theme-source wiring
             if theme_src and theme_src in proc_ids:
                 deps.append(theme_src)
             # remove duplicates preserving order
-            seen = set()
-            cleaned: List[str] = []
-            for d in deps:
-                if d not in seen:
-                    seen.add(d)
-                    cleaned.append(d)
-            edges[alias] = cleaned
+            edges[alias] = list(dict.fromkeys(deps))
         return edges
@@ -1,47 +1,17 @@
-import os
 from typing import List, Union
-import pandas as pd
 from typing import Optional
+from pulse._loaders import get_strings
 from pulse.analysis.analyzer import Analyzer
 from pulse.analysis.processes import Cluster, SentimentProcess, ThemeAllocation
 from pulse.analysis.results import ClusterResult, SentimentResult, ThemeAllocationResult
 from pulse.auth import _BaseOAuth2Auth
 
-
-def _load_csv_tsv(path: str) -> List[str]:
-    sep = "," if path.lower().endswith(".csv") else "\t"
-    df = pd.read_csv(path, sep=sep, header=None)
-    return df.iloc[:, 0].dropna().astype(str).tolist()
-
-
-def _load_excel(path: str) -> List[str]:
-    df = pd.read_excel(path, sheet_name=0, header=None)
-    return df.iloc[:, 0].dropna().astype(str).tolist()
-
-
-def _load_text(path: str) -> List[str]:
-    with open(path, "r", encoding="utf-8") as file:
-        lines = file.readlines()
-    return [line.strip() for line in lines if line.strip()]
-
-
-def get_strings(source: Union[List[str], str]) -> List[str]:
-    """
-    Load input strings from a list or a file path.
-    Supports .txt, .csv, .tsv, .xls, .xlsx
-    """
-    if isinstance(source, list):
-        return source
-    if not isinstance(source, str) or not os.path.exists(source):
-        raise ValueError("Provide a list of strings or a valid file path")
-    ext = os.path.splitext(source)[1].lower()
-    if ext == ".txt":
-        return _load_text(source)
-    if ext in (".csv", ".tsv"):
-        return _load_csv_tsv(source)
-    if ext in (".xls", ".xlsx"):
-        return _load_excel(source)
-    raise ValueError(f"Unsupported file type: {ext}")
+__all__ = [
+    "get_strings",
+    "sentiment_analysis",
+    "theme_allocation",
+    "cluster_analysis",
+]
 
 
 def sentiment_analysis(
@@ -32,8 +32,57 @@ def vcr_config():
     """
     Configure pytest-vcr to ignore request body when matching cassettes,
     avoiding mismatches due to client_secret values.
+
+    Cassettes are replayed only; re-record with ``pytest --vcr-record=...``
+    (see ``make vcr-record``).
     """
     return {
         # Only match on HTTP method, scheme, host, port, path, and query parameters
         "match_on": ["method", "scheme", "host", "port", "path", "query"],
+        # never reach the network for requests missing from a cassette
+        "record_mode": "none",
     }
+
+
+@pytest.fixture(autouse=True, scope="session")
+def disable_sleep(request):
+    """
+    Skip the waits between Job polls for the whole session while replaying
+    cassettes; re-recording (``--vcr-record``) keeps real waits.
+    """
+    if request.config.getoption("vcr_record") not in (None, "none"):
+        yield
+        return
+    from pulse.core import jobs
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(jobs, "_sleep", lambda seconds: None)
+        yield
+
+
+@pytest.fixture(scope="session")
+def core_client():
+    """
+    CoreClient authenticated from the ``PULSE_*`` environment variables and
+    shared by every recorded test in the session, so the token and connection
+    pool are set up once.
+    """
+    from pulse.auth import ClientCredentialsAuth
+    from pulse.core.client import CoreClient
+
+    client_id = os.getenv("PULSE_CLIENT_ID")
+    client_secret = os.getenv("PULSE_CLIENT_SECRET")
+    if not client_id or not client_secret:
+        pytest.skip("Pulse client credentials not set")
+    base_url = "https://dev.core.researchwiseai.com/pulse/v1"
+    auth = ClientCredentialsAuth(
+        client_id=client_id,
+        client_secret=client_secret,
+        token_url=os.getenv(
+            "PULSE_TOKEN_URL", "https://wise-dev.eu.auth0.com/oauth/token"
+        ),
+        audience=os.getenv("PULSE_AUDIENCE", base_url),
+    )
+    client = CoreClient(base_url=base_url, auth=auth)
+    yield client
+    client.close()
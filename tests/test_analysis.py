@@ -2,7 +2,6 @@
 
 import pandas as pd
 import pytest
-import os
 
 # from pydantic import BaseModel  # Unused import removed
 
@@ -11,9 +10,8 @@ from pulse.analysis.processes import (
     ThemeGeneration,
     SentimentProcess,
     ThemeAllocation,
+    Cluster,
 )
-from pulse.auth import ClientCredentialsAuth
-from pulse.core.client import CoreClient
 from pulse.core.models import SentimentResult, Theme
 
 reviews = [
@@ -40,36 +38,9 @@ reviews = [
 ]
 
 
-@pytest.fixture(autouse=True)
-def disable_sleep(monkeypatch):
-    import time
-
-    monkeypatch.setattr(time, "sleep", lambda x: None)
-
-
-base_url = "https://dev.core.researchwiseai.com/pulse/v1"
-
-# Load credentials from environment variables
-client_id = os.getenv("PULSE_CLIENT_ID")
-client_secret = os.getenv("PULSE_CLIENT_SECRET")
-if not client_id or not client_secret:
-    pytest.skip("Pulse client credentials not set", allow_module_level=True)
-token_url = os.getenv("PULSE_TOKEN_URL", "https://wise-dev.eu.auth0.com/oauth/token")
-audience = os.getenv("PULSE_AUDIENCE", base_url)
-auth = ClientCredentialsAuth(
-    client_id=client_id,
-    client_secret=client_secret,
-    token_url=token_url,
-    audience=audience,
-)
-
-
 @pytest.mark.vcr()
-def test_analyzer_no_processes():
-    client = CoreClient(
-        base_url="https://dev.core.researchwiseai.com/pulse/v1", auth=auth
-    )
-    az = Analyzer(dataset=reviews, processes=[], client=client)
+def test_analyzer_no_processes(core_client):
+    az = Analyzer(dataset=reviews, processes=[], client=core_client)
     res = az.run()
     assert isinstance(res, AnalysisResult)
     with pytest.raises(AttributeError):
@@ -77,12 +48,9 @@ def test_analyzer_no_processes():
 
 
 @pytest.mark.vcr()
-def test_theme_generation_process():
-    client = CoreClient(
-        base_url="https://dev.core.researchwiseai.com/pulse/v1", auth=auth
-    )
+def test_theme_generation_process(core_client):
     proc = ThemeGeneration(min_themes=2, max_themes=3)
-    az = Analyzer(dataset=reviews, processes=[proc], fast=True, client=client)
+    az = Analyzer(dataset=reviews, processes=[proc], fast=True, client=core_client)
     res = az.run()
 
     # result attribute name matches process id
@@ -98,12 +66,9 @@ def test_theme_generation_process():
 
 
 @pytest.mark.vcr()
-def test_sentiment_process():
-    client = CoreClient(
-        base_url="https://dev.core.researchwiseai.com/pulse/v1", auth=auth
-    )
+def test_sentiment_process(core_client):
     proc = SentimentProcess(fast=True)
-    az = Analyzer(dataset=reviews, processes=[proc], client=client)
+    az = Analyzer(dataset=reviews, processes=[proc], client=core_client)
     res = az.run()
 
     sent = res.sentiment
@@ -126,13 +91,10 @@ def test_sentiment_process():
 
 
 @pytest.mark.vcr()
-def test_theme_allocation_with_static_themes():
-    client = CoreClient(
-        base_url="https://dev.core.researchwiseai.com/pulse/v1", auth=auth
-    )
+def test_theme_allocation_with_static_themes(core_client):
     static_themes = ["Service", "Atmosphere", "Amenities"]
     proc = ThemeAllocation(themes=static_themes, single_label=True, threshold=0.3)
-    az = Analyzer(dataset=reviews, processes=[proc], fast=True, client=client)
+    az = Analyzer(dataset=reviews, processes=[proc], fast=True, client=core_client)
     res = az.run()
 
     ta = res.theme_allocation
@@ -150,13 +112,12 @@ def test_theme_allocation_with_static_themes():
 
 
 @pytest.mark.vcr()
-def test_theme_allocation_with_generator():
-    client = CoreClient(
-        base_url="https://dev.core.researchwiseai.com/pulse/v1", auth=auth
-    )
+def test_theme_allocation_with_generator(core_client):
     gen = ThemeGeneration(min_themes=2, max_themes=3)
     alloc = ThemeAllocation(single_label=False, threshold=0.5)
-    az = Analyzer(dataset=reviews, processes=[gen, alloc], fast=True, client=client)
+    az = Analyzer(
+        dataset=reviews, processes=[gen, alloc], fast=True, client=core_client
+    )
     res = az.run()
 
     tg = res.theme_generation
@@ -176,12 +137,9 @@ def test_theme_allocation_with_generator():
 
 
 @pytest.mark.vcr()
-def test_theme_allocation_implicit_generation():
-    client = CoreClient(
-        base_url="https://dev.core.researchwiseai.com/pulse/v1", auth=auth
-    )
+def test_theme_allocation_implicit_generation(core_client):
     alloc = ThemeAllocation()
-    az = Analyzer(dataset=reviews, processes=[alloc], fast=True, client=client)
+    az = Analyzer(dataset=reviews, processes=[alloc], fast=True, client=core_client)
     res = az.run()
 
     # ThemeGeneration should be implicitly run
@@ -197,3 +155,75 @@ def test_theme_allocation_implicit_generation():
     # ensure allocation themes come from generation
     assert hasattr(ta, "_themes")
     assert len(ta._themes) == len(tg.themes)
+
+
+def test_independent_processes_run_concurrently():
+    import threading
+
+    from pulse.core.models import SentimentResponse, ThemesResponse
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    class BarrierClient:
+        # each call blocks until the other process is running as well
+        def generate_themes(self, texts, min_themes, max_themes, fast):
+            barrier.wait()
+            return ThemesResponse(themes=[], requestId=None)
+
+        def analyze_sentiment(self, texts, fast):
+            barrier.wait()
+            return SentimentResponse(
+                results=[{"sentiment": "neutral", "confidence": 0.5} for _ in texts]
+            )
+
+    az = Analyzer(
+        dataset=["a", "b"],
+        processes=[ThemeGeneration(), SentimentProcess()],
+        client=BarrierClient(),
+    )
+    res = az.run()
+    assert res.theme_generation.themes == []
+    assert len(res.sentiment.sentiments) == 2
+
+
+def test_cluster_batches_large_inputs_without_fast():
+    import httpx
+    import numpy as np
+
+    from pulse.core.client import CoreClient
+
+    texts = [f"review {i}" for i in range(250)]
+    n = len(texts)
+    # similarity encodes row and column so misplaced values are detected
+    expected = np.add.outer(np.arange(n), np.arange(n)).astype(np.float32)
+    rows, cols = np.triu_indices(n, k=1)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/similarity":
+            return httpx.Response(202, json={"jobId": "s1"})
+        if request.url.path == "/jobs":
+            return httpx.Response(
+                200, json={"jobId": "s1", "jobStatus": "completed", "resultUrl": "/r"}
+            )
+        return httpx.Response(
+            200,
+            json={
+                "scenario": "self",
+                "mode": "flattened",
+                "n": n,
+                "flattened": expected[rows, cols].tolist(),
+            },
+        )
+
+    http = httpx.Client(
+        base_url="https://example.com", transport=httpx.MockTransport(handler)
+    )
+    az = Analyzer(
+        dataset=texts,
+        processes=[Cluster(fast=False)],
+        client=CoreClient(client=http),
+        use_cache=False,
+    )
+    sim = az.run().cluster.matrix
+    np.fill_diagonal(expected, 1.0)
+    assert np.array_equal(sim, expected)
@@ -0,0 +1,118 @@
+"""Unit tests for AsyncCoreClient using an in-memory transport."""
+
+import asyncio
+
+import httpx
+
+from pulse.core import jobs
+from pulse.core.async_client import AsyncCoreClient
+
+
+def _client(handler) -> AsyncCoreClient:
+    transport = httpx.MockTransport(handler)
+    return AsyncCoreClient(
+        client=httpx.AsyncClient(base_url="https://example.com", transport=transport)
+    )
+
+
+def test_concurrent_requests_share_one_client():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        texts = httpx.Response(200, content=request.content).json()["inputs"]
+        if request.url.path == "/sentiment":
+            results = [{"sentiment": "positive", "confidence": 0.5} for _ in texts]
+            return httpx.Response(200, json={"results": results})
+        docs = [{"text": t, "vector": [0.1, 0.2]} for t in texts]
+        return httpx.Response(200, json={"embeddings": docs})
+
+    async def main():
+        client = _client(handler)
+        try:
+            return await asyncio.gather(
+                client.analyze_sentiment(["a", "b"]),
+                client.create_embeddings(["c"]),
+            )
+        finally:
+            await client.aclose()
+
+    sentiment, embeddings = asyncio.run(main())
+    assert sorted(seen) == ["/embeddings", "/sentiment"]
+    assert [r.sentiment for r in sentiment.results] == ["positive", "positive"]
+    assert len(embeddings.embeddings) == 1
+
+
+def test_batch_size_gathers_sub_batches_in_order():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        texts = httpx.Response(200, content=request.content).json()["inputs"]
+        seen.append(texts)
+        docs = [{"text": t, "vector": [0.0]} for t in texts]
+        return httpx.Response(200, json={"embeddings": docs})
+
+    async def main():
+        client = _client(handler)
+        try:
+            return await client.create_embeddings(["a", "b", "c"], batch_size=2)
+        finally:
+            await client.aclose()
+
+    resp = asyncio.run(main())
+    assert [doc.text for doc in resp.embeddings] == ["a", "b", "c"]
+    assert sorted(seen) == [["a", "b"], ["c"]]
+
+
+def test_enqueued_job_is_awaited(monkeypatch):
+    monkeypatch.setattr(jobs, "_POLL_INITIAL_INTERVAL", 0.0)
+    statuses = iter(["pending", "completed"])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/sentiment":
+            return httpx.Response(202, json={"jobId": "j1"})
+        if request.url.path == "/jobs":
+            return httpx.Response(
+                200,
+                json={"jobId": "j1", "jobStatus": next(statuses), "resultUrl": "/r"},
+            )
+        results = [{"sentiment": "negative", "confidence": 0.7}]
+        return httpx.Response(200, json={"results": results})
+
+    async def main():
+        client = _client(handler)
+        try:
+            return await client.analyze_sentiment(["a"], fast=False)
+        finally:
+            await client.aclose()
+
+    resp = asyncio.run(main())
+    assert [r.sentiment for r in resp.results] == ["negative"]
+
+
+def test_async_context_manager_closes_pool():
+    async def main():
+        async with _client(lambda request: httpx.Response(200)) as client:
+            assert not client.client.is_closed
+        return client
+
+    assert asyncio.run(main()).client.is_closed
+
+
+def test_auth_constructors_build_the_async_client():
+    client = AsyncCoreClient.with_client_credentials(
+        client_id="id", client_secret="secret"
+    )
+    assert type(client) is AsyncCoreClient
+    pkce = AsyncCoreClient.with_pkce(
+        code="code",
+        code_verifier="verifier",
+        client_id="id",
+        redirect_uri="https://example.com/cb",
+    )
+    assert type(pkce) is AsyncCoreClient
+    for created in (client, pkce):
+        asyncio.run(created.aclose())
+    for method in (AsyncCoreClient.with_client_credentials, AsyncCoreClient.with_pkce):
+        assert method.__annotations__["return"] == "AsyncCoreClient"
+        assert "AsyncCoreClient" in method.__doc__
@@ -1,4 +1,5 @@
 """Unit tests for pulse.core.batching batching utilities."""
+
 import numpy as np
 
 from pulse.core import batching
@@ -146,3 +147,36 @@ def test_stitch_results_cross(monkeypatch):
             expected = (i + 1) * 10 + (j + 1)
             assert np.all(matrix[r0:r1, c0:c1] == expected)
             idx += 1
+
+
+def test_stitch_results_flattened_dict_blocks(monkeypatch):
+    # Job results are decoded JSON: self blocks as upper triangles, cross
+    # blocks as flattened rows
+    monkeypatch.setattr(batching, "MAX_ITEMS", 5)
+    monkeypatch.setattr(batching, "HALF_CHUNK", 3)
+    full = list(range(6))
+    expected = np.add.outer(np.arange(6), np.arange(6)) * 10.0
+    np.fill_diagonal(expected, 1.0)
+    rows, cols = np.triu_indices(3, k=1)
+    results = [
+        {
+            "scenario": "self",
+            "mode": "flattened",
+            "n": 3,
+            "flattened": expected[:3, :3][rows, cols].tolist(),
+        },
+        {
+            "scenario": "cross",
+            "mode": "flattened",
+            "n": 3,
+            "flattened": expected[:3, 3:].ravel().tolist(),
+        },
+        {
+            "scenario": "self",
+            "mode": "flattened",
+            "n": 3,
+            "flattened": expected[3:, 3:][rows, cols].tolist(),
+        },
+    ]
+    matrix = batching._stitch_results(results, [], full, full)
+    assert np.array_equal(matrix, expected)
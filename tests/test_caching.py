@@ -88,3 +88,18 @@ def test_disable_caching(tmp_path, cache_dir):
     # call_count should increment twice
     assert proc.call_count == 2
     az.close()
+
+
+def test_in_memory_cache_backend(tmp_path):
+    cache = {}
+    proc = DummyProcess()
+    az = Analyzer(dataset=["x"], processes=[proc], cache_backend=cache, auth=auth)
+    assert az.run().dummy == "result_1"
+    assert az.run().dummy == "result_1"
+    assert proc.call_count == 1
+    assert len(cache) == 1
+    # nothing is written to disk
+    assert not any(tmp_path.iterdir())
+    az.clear_cache()
+    assert cache == {}
+    az.close()
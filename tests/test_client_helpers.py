@@ -0,0 +1,174 @@
+"""Unit tests for CoreClient request helpers using an in-memory transport."""
+
+import threading
+
+import httpx
+
+from pulse.core.client import CoreClient
+
+
+def test_sentiment_batches_run_concurrently_and_keep_order():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        # deadlocks (and times out) unless both batches are in flight at once
+        barrier.wait()
+        texts = httpx.Response(200, content=request.content).json()["inputs"]
+        label = "positive" if texts[0] == "a" else "negative"
+        results = [{"sentiment": label, "confidence": 0.5} for _ in texts]
+        return httpx.Response(200, json={"results": results})
+
+    client = CoreClient(
+        client=httpx.Client(
+            base_url="https://example.com", transport=httpx.MockTransport(handler)
+        )
+    )
+    resp = client.analyze_sentiment_batched([["a", "b"], ["c"]], concurrency=2)
+    assert [r.sentiment for r in resp.results] == ["positive", "positive", "negative"]
+
+
+def test_small_bodies_are_encoded_once():
+    from pulse.core.client import _dumps_frozen, _encode_body
+
+    _dumps_frozen.cache_clear()
+    body = {"inputs": ["a", "b"], "themes": ["T"], "fast": True}
+    first = _encode_body(body)
+    assert _encode_body(dict(body)) is first
+    assert first == b'{"inputs":["a","b"],"themes":["T"],"fast":true}'
+    # unhashable or non-string inputs still encode, just without the cache
+    assert _encode_body({"inputs": [["a"]]}) == b'{"inputs":[["a"]]}'
+    assert _dumps_frozen.cache_info().currsize == 1
+
+
+def test_similarity_response_is_streamed_and_errors_keep_detail():
+    import pytest
+
+    from pulse.core.exceptions import PulseAPIError
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/embeddings":
+            return httpx.Response(400, json={"error": "bad input"})
+        body = {"scenario": "self", "mode": "flattened", "n": 2, "flattened": [0.5]}
+        return httpx.Response(200, json=body)
+
+    client = CoreClient(
+        client=httpx.Client(
+            base_url="https://example.com", transport=httpx.MockTransport(handler)
+        )
+    )
+    resp = client.compare_similarity(set=["a", "b"])
+    assert resp.similarity == [[1.0, 0.5], [0.5, 1.0]]
+    with pytest.raises(PulseAPIError) as err:
+        client.create_embeddings(["a"])
+    assert err.value.detail == {"error": "bad input"}
+
+
+def test_default_client_accepts_gzip_responses():
+    client = CoreClient(auth=httpx.BasicAuth("user", "pass"))
+    request = client.client.build_request("POST", "/sentiment", content=b"{}")
+    assert "gzip" in request.headers["Accept-Encoding"]
+    client.close()
+
+
+def test_context_manager_closes_pool():
+    with CoreClient(auth=httpx.BasicAuth("user", "pass")) as client:
+        assert not client.client.is_closed
+    assert client.client.is_closed
+
+
+def test_empty_inputs_skip_the_request():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError(f"unexpected request to {request.url.path}")
+
+    client = CoreClient(
+        client=httpx.Client(
+            base_url="https://example.com", transport=httpx.MockTransport(handler)
+        )
+    )
+    assert client.create_embeddings([]).embeddings == []
+    assert client.analyze_sentiment([]).results == []
+    assert client.extract_elements([], themes=["T"]).extractions == []
+
+
+def test_warmup_opens_a_connection_and_ignores_failures():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.method)
+        raise httpx.ConnectError("offline", request=request)
+
+    CoreClient(
+        client=httpx.Client(
+            base_url="https://example.com", transport=httpx.MockTransport(handler)
+        ),
+        warmup=True,
+    )
+    assert seen == ["OPTIONS"]
+
+
+def test_api_error_detail_falls_back_to_text():
+    from pulse.core.exceptions import PulseAPIError
+
+    err = PulseAPIError(httpx.Response(502, content=b"Bad Gateway"))
+    assert err.status_code == 502
+    assert err.detail == "Bad Gateway"
+    assert str(err) == "Status code: 502, Detail: Bad Gateway"
+
+
+def test_batch_size_splits_inputs_and_keeps_order():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        texts = httpx.Response(200, content=request.content).json()["inputs"]
+        seen.append((request.url.path, texts))
+        if request.url.path == "/extractions":
+            return httpx.Response(200, json={"extractions": [[[t]] for t in texts]})
+        docs = [{"text": t, "vector": [0.0]} for t in texts]
+        return httpx.Response(200, json={"embeddings": docs})
+
+    client = CoreClient(
+        client=httpx.Client(
+            base_url="https://example.com", transport=httpx.MockTransport(handler)
+        )
+    )
+    emb = client.create_embeddings(["a", "b", "c"], batch_size=2)
+    assert [doc.text for doc in emb.embeddings] == ["a", "b", "c"]
+    ext = client.extract_elements(["a", "b", "c"], ["T"], batch_size=1)
+    assert ext.extractions == [[["a"]], [["b"]], [["c"]]]
+    assert sorted(seen) == [
+        ("/embeddings", ["a", "b"]),
+        ("/embeddings", ["c"]),
+        ("/extractions", ["a"]),
+        ("/extractions", ["b"]),
+        ("/extractions", ["c"]),
+    ]
+
+
+def test_fast_job_warning_points_at_the_caller():
+    import warnings
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            texts = httpx.Response(200, content=request.content).json()["inputs"]
+            return httpx.Response(202, json={"jobId": ",".join(texts)})
+        if request.url.path == "/jobs":
+            job_id = request.url.params["jobId"]
+            return httpx.Response(
+                200,
+                json={"jobId": job_id, "jobStatus": "completed", "resultUrl": "/r"},
+            )
+        docs = [{"text": "a", "vector": [0.0]}]
+        return httpx.Response(200, json={"embeddings": docs})
+
+    client = CoreClient(
+        client=httpx.Client(
+            base_url="https://example.com", transport=httpx.MockTransport(handler)
+        )
+    )
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        client.create_embeddings(["a"])
+        client.create_embeddings(["a", "b"], batch_size=1)
+        client.create_embeddings_batched([["a"], ["b"]])
+    assert len(caught) == 5
+    assert {w.filename for w in caught} == {__file__}
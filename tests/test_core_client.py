@@ -3,41 +3,14 @@
 All HTTP interactions are recorded and replayed; no manual mocks.
 """
 import pytest
-import os
 
-from pulse.auth import ClientCredentialsAuth
-from pulse.core.client import CoreClient
 from pulse.core.exceptions import PulseAPIError
 
-pytestmark = pytest.mark.vcr(record_mode="new_episodes")
+pytestmark = pytest.mark.vcr()
 
-base_url = "https://dev.core.researchwiseai.com/pulse/v1"
 
-# Load credentials from environment variables
-client_id = os.getenv("PULSE_CLIENT_ID")
-client_secret = os.getenv("PULSE_CLIENT_SECRET")
-if not client_id or not client_secret:
-    pytest.skip("Pulse client credentials not set", allow_module_level=True)
-token_url = os.getenv("PULSE_TOKEN_URL", "https://wise-dev.eu.auth0.com/oauth/token")
-audience = os.getenv("PULSE_AUDIENCE", base_url)
-auth = ClientCredentialsAuth(
-    client_id=client_id,
-    client_secret=client_secret,
-    token_url=token_url,
-    audience=audience,
-)
-
-
-@pytest.fixture(autouse=True)
-def disable_sleep(monkeypatch):
-    import time
-
-    monkeypatch.setattr(time, "sleep", lambda x: None)
-
-
-def test_create_embeddings_fast():
-    client = CoreClient(base_url=base_url, auth=auth)
-    response = client.create_embeddings(["a", "b"], fast=True)
+def test_create_embeddings_fast(core_client):
+    response = core_client.create_embeddings(["a", "b"], fast=True)
 
     # Check that the response is a valid EmbeddingResponse object
     assert response is not None
@@ -51,10 +24,8 @@ def test_create_embeddings_fast():
     assert response.embeddings[1].text is not None
 
 
-def test_compare_similarity_fast():
-    client = CoreClient(base_url=base_url, auth=auth)
-
-    response = client.compare_similarity(set=["x", "y"], fast=True, flatten=False)
+def test_compare_similarity_fast(core_client):
+    response = core_client.compare_similarity(set=["x", "y"], fast=True, flatten=False)
     # Check that the response is a valid SimilarityResponse object
     assert response is not None
     assert hasattr(response, "requestId")
@@ -79,9 +50,8 @@ def test_compare_similarity_fast():
     assert isinstance(response.n, int)
 
 
-def test_generate_themes_fast():
-    client = CoreClient(base_url=base_url, auth=auth)
-    response = client.generate_themes(
+def test_generate_themes_fast(core_client):
+    response = core_client.generate_themes(
         ["apple", "orange", "banana", "melon", "goat", "horse", "cow", "pig"],
         min_themes=1,
         max_themes=3,
@@ -102,9 +72,8 @@ def test_generate_themes_fast():
     assert hasattr(response.themes[1], "representatives")
 
 
-def test_analyze_sentiment_fast():
-    client = CoreClient(base_url=base_url, auth=auth)
-    response = client.analyze_sentiment(["happy", "sad"], fast=True)
+def test_analyze_sentiment_fast(core_client):
+    response = core_client.analyze_sentiment(["happy", "sad"], fast=True)
     # Check that the response is a valid SentimentResponse object
     assert hasattr(response, "results")
     assert hasattr(response, "requestId")
@@ -121,7 +90,6 @@ def test_analyze_sentiment_fast():
     assert 0 <= response.results[1].confidence <= 1
 
 
-def test_error_raises():
-    client = CoreClient(base_url=base_url, auth=auth)
+def test_error_raises(core_client):
     with pytest.raises(PulseAPIError):
-        client.create_embeddings([False], fast=True)
+        core_client.create_embeddings([False], fast=True)
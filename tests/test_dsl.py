@@ -0,0 +1,273 @@
+"""Unit tests for the DSL Workflow runner using an in-memory client."""
+
+from types import SimpleNamespace
+
+from pulse.core.models import SentimentResponse
+from pulse.dsl import Workflow
+
+
+class DummyClient:
+    """Minimal CoreClient stand-in that records calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def analyze_sentiment(self, texts, fast=True):
+        self.calls.append(("sentiment", list(texts)))
+        return SentimentResponse(
+            results=[{"sentiment": "positive", "confidence": 0.9} for _ in texts]
+        )
+
+
+def test_sentiment_flat_input_runs_once():
+    client = DummyClient()
+    wf = Workflow().source("comments", ["a", "b"]).sentiment(source="comments")
+    results = wf.run(client=client)
+    assert len(client.calls) == 1
+    assert [r.confidence for r in results.sentiment.sentiments] == [0.9, 0.9]
+
+
+def test_sentiment_nested_input_is_flattened_once():
+    client = DummyClient()
+    wf = (
+        Workflow()
+        .source("comments", [["a", "b"], ["c", "d"]])
+        .sentiment(source="comments")
+    )
+    results = wf.run(client=client)
+    assert client.calls == [("sentiment", ["a", "b", "c", "d"])]
+    assert len(results.sentiment.sentiments) == 4
+
+
+def test_from_file_reuses_parsed_pipeline(tmp_path):
+    import json
+
+    from pulse.dsl import _parse_config
+
+    path = tmp_path / "pipeline.json"
+    path.write_text(
+        json.dumps(
+            {
+                "pipeline": [
+                    {"theme_allocation": {"themes": ["A", "B"]}},
+                    {"cluster": {}},
+                ]
+            }
+        )
+    )
+    _parse_config.cache_clear()
+    wf1 = Workflow.from_file(str(path))
+    wf2 = Workflow.from_file(str(path))
+    assert _parse_config.cache_info().hits == 1
+    assert [p.id for p in wf1._processes] == ["theme_allocation", "cluster"]
+    # each workflow gets its own copy of the step params
+    assert wf1._processes[0].themes == ["A", "B"]
+    assert wf1._processes[0].themes is not wf2._processes[0].themes
+
+
+def test_from_file_yaml(tmp_path):
+    path = tmp_path / "pipeline.yaml"
+    path.write_text("pipeline:\n  - sentiment:\n      fast: false\n  - cluster: {}\n")
+    wf = Workflow.from_file(str(path))
+    assert [p.id for p in wf._processes] == ["sentiment", "cluster"]
+    assert wf._processes[0].fast is False
+
+
+def test_reconstruct_ragged_rows_by_offsets():
+    from pulse.dsl import _flatten_and_shape, _reconstruct
+
+    data = [["a"], ["b", "c"], []]
+    shape, flat = _flatten_and_shape(data)
+    assert flat == ["a", "b", "c"]
+    assert _reconstruct(flat, shape, template=data) == data
+
+
+def test_graph_cached_until_process_added():
+    wf = Workflow().theme_generation().theme_allocation()
+    first = wf.graph()
+    assert first == {
+        "theme_generation": [],
+        "theme_allocation": ["theme_generation"],
+    }
+    first["theme_allocation"].append("mutated")
+    assert wf.graph()["theme_allocation"] == ["theme_generation"]
+
+    wf.sentiment()
+    assert "sentiment" in wf.graph()
+
+
+def test_theme_extraction_does_not_mutate_process_themes():
+    from pulse.core.models import ExtractionsResponse
+
+    class ExtractClient(DummyClient):
+        def extract_elements(self, inputs, themes, version=None, fast=None):
+            self.calls.append(("extract", list(themes)))
+            return ExtractionsResponse(extractions=[[["x"]] for _ in inputs])
+
+    client = ExtractClient()
+    wf = (
+        Workflow()
+        .source("comments", ["a", "b"])
+        .source("themes", ["T1"])
+        .theme_extraction(inputs="comments", themes_from="themes")
+    )
+    results = wf.run(client=client)
+    assert client.calls == [("extract", ["T1"])]
+    assert results.theme_extraction.extractions == [[["x"]], [["x"]]]
+    assert wf._processes[0].themes is None
+
+
+def test_topological_layers_group_independent_processes():
+    from pulse.dsl import _topological_layers
+
+    edges = {"a": [], "b": [], "c": ["a", "b"], "d": ["c"], "e": []}
+    assert _topological_layers(edges) == [["a", "b", "e"], ["c"], ["d"]]
+
+
+def test_independent_branches_run_concurrently():
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    class BarrierClient(DummyClient):
+        def analyze_sentiment(self, texts, fast=True):
+            # deadlocks (and times out) unless both branches run at once
+            barrier.wait()
+            return super().analyze_sentiment(texts, fast=fast)
+
+    client = BarrierClient()
+    wf = (
+        Workflow()
+        .source("a", ["x"])
+        .source("b", ["y", "z"])
+        .sentiment(source="a", name="sa")
+        .sentiment(source="b", name="sb")
+    )
+    results = wf.run(client=client)
+    assert len(results.sa.sentiments) == 1
+    assert len(results.sb.sentiments) == 2
+
+
+def test_theme_allocation_requests_only_text_theme_block():
+    class SimilarityClient(DummyClient):
+        def compare_similarity(self, **kwargs):
+            self.calls.append(("similarity", kwargs))
+            n, m = len(kwargs["set_a"]), len(kwargs["set_b"])
+            return [[0.9 if j == i % m else 0.1 for j in range(m)] for i in range(n)]
+
+    client = SimilarityClient()
+    wf = (
+        Workflow()
+        .source("comments", ["a", "b", "c"])
+        .theme_allocation(inputs="comments", themes=["T1", "T2"])
+    )
+    results = wf.run(client=client)
+    ((_, kwargs),) = client.calls
+    assert kwargs["set_a"] == ["a", "b", "c"]
+    assert kwargs["set_b"] == ["T1", "T2"]
+    assert "set" not in kwargs
+    assert results.theme_allocation.assign_single().tolist() == ["T1", "T2", "T1"]
+
+
+def test_cluster_sends_each_distinct_text_once():
+    class SimilarityClient(DummyClient):
+        def compare_similarity(self, **kwargs):
+            self.calls.append(("similarity", kwargs))
+            texts = kwargs["set"]
+            return SimpleNamespace(
+                similarity=[
+                    [1.0 if a == b else 0.5 for b in range(len(texts))]
+                    for a in range(len(texts))
+                ]
+            )
+
+    client = SimilarityClient()
+    wf = Workflow().source("comments", ["a", "b", "a"]).cluster(source="comments")
+    results = wf.run(client=client)
+    ((_, kwargs),) = client.calls
+    assert kwargs["set"] == ["a", "b"]
+    assert results.cluster.matrix.tolist() == [
+        [1.0, 0.5, 1.0],
+        [0.5, 1.0, 0.5],
+        [1.0, 0.5, 1.0],
+    ]
+
+
+def test_identical_steps_on_one_source_share_a_request():
+    client = DummyClient()
+    wf = (
+        Workflow()
+        .source("comments", ["a", "b"])
+        .sentiment(source="comments", name="s1")
+        .sentiment(source="comments", name="s2")
+        .sentiment(source="comments", name="s3", fast=False)
+    )
+    results = wf.run(client=client)
+    assert client.calls == [("sentiment", ["a", "b"])] * 2
+    assert results.s1.sentiments == results.s2.sentiments
+    assert len(results.s3.sentiments) == 2
+
+
+def test_list_source_is_not_copied_for_processes():
+    texts = ["a", "b"]
+    seen = []
+
+    class RecordingClient(DummyClient):
+        def analyze_sentiment(self, texts, fast=True):
+            seen.append(texts)
+            return super().analyze_sentiment(texts, fast=fast)
+
+    Workflow().source("comments", texts).sentiment(source="comments").run(
+        client=RecordingClient()
+    )
+    assert seen[0] is texts
+
+
+def test_cluster_mirrors_flattened_upper_triangle():
+    import numpy as np
+
+    from pulse.analysis.processes import _similarity_array
+    from pulse.core.models import SimilarityResponse
+
+    for flat in ([0.2, 0.3, 0.4], [1.0, 0.2, 0.3, 1.0, 0.4, 1.0]):
+        resp = SimilarityResponse(
+            scenario="self", mode="flattened", n=3, flattened=flat
+        )
+        np.testing.assert_allclose(_similarity_array(resp), resp.similarity)
+
+
+def test_non_list_source_is_converted_once_for_all_readers():
+    import pandas as pd
+
+    seen = []
+
+    class RecordingClient(DummyClient):
+        def analyze_sentiment(self, texts, fast=True):
+            seen.append(texts)
+            return super().analyze_sentiment(texts, fast=fast)
+
+    (
+        Workflow()
+        .source("comments", ("a", "b"))
+        .sentiment(source="comments", name="s1")
+        .sentiment(source="comments", name="s2", fast=False)
+        .run(client=RecordingClient())
+    )
+    assert seen[0] == ["a", "b"]
+    assert seen[0] is seen[1]
+    assert not isinstance(seen[0], pd.Series)
+
+
+def test_missing_source_is_rejected_before_any_request():
+    import pytest
+
+    client = DummyClient()
+    wf = (
+        Workflow()
+        .source("comments", ["a"])
+        .sentiment(source="comments", name="first")
+        .sentiment(name="second")
+    )
+    with pytest.raises(ValueError, match="Source 'dataset' not found"):
+        wf.run(client=client)
+    assert client.calls == []
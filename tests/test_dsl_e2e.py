@@ -8,14 +8,6 @@ from pulse.dsl import Workflow
 from pulse.core.jobs import Job
 from pulse.core.client import CoreClient
 
-
-@pytest.fixture(autouse=True)
-def disable_sleep(monkeypatch):
-    import time
-
-    monkeypatch.setattr(time, "sleep", lambda x: None)
-
-
 base_url = "https://dev.core.researchwiseai.com/pulse/v1"
 
 # Load credentials from environment variables
@@ -0,0 +1,52 @@
+"""Unit tests for the gzip request-compressing HTTPX client."""
+
+import gzip
+
+from pulse.core.gzip_client import GzipClient, _gzip
+
+
+def test_gzip_matches_stdlib_output():
+    for data in (b"", b"hello", b"x" * 100_000):
+        assert _gzip(data) == gzip.compress(data, mtime=0)
+        assert gzip.decompress(_gzip(data)) == data
+
+
+def test_build_request_compresses_content():
+    client = GzipClient(base_url="https://example.com")
+    request = client.build_request("POST", "/x", content=b'{"a": 1}')
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(request.content) == b'{"a": 1}'
+    client.close()
+
+
+def test_build_request_does_not_mutate_caller_headers():
+    client = GzipClient(base_url="https://example.com")
+    headers = {"Content-Type": "application/json"}
+    request = client.build_request("POST", "/x", content=b"{}", headers=headers)
+    assert request.headers["Content-Type"] == "application/json"
+    assert headers == {"Content-Type": "application/json"}
+    client.close()
+
+
+def test_core_client_compresses_request_bodies_only_when_asked(monkeypatch):
+    import httpx
+
+    from pulse.core.client import CoreClient
+
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={})
+
+    for compress in (False, True):
+        core = CoreClient(
+            auth=httpx.BasicAuth("user", "pass"), compress_requests=compress
+        )
+        monkeypatch.setattr(core.client, "_transport", httpx.MockTransport(handler))
+        core._post_json("/x", {"a": 1})
+    plain, compressed = seen
+    assert "Content-Encoding" not in plain.headers
+    assert plain.content == b'{"a":1}'
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(compressed.content) == b'{"a":1}'
@@ -0,0 +1,291 @@
+"""Unit tests for the Job polling model."""
+
+import pytest
+
+from pulse.core.jobs import Job
+
+
+def test_job_from_json_reads_api_aliases():
+    job = Job._from_json(
+        {"jobId": "abc", "jobStatus": "completed", "resultUrl": "https://x/y"}
+    )
+    assert job.id == "abc"
+    assert job.status == "completed"
+    assert job.result_url == "https://x/y"
+    assert job.message is None
+
+
+def test_job_from_json_reads_field_names():
+    job = Job._from_json({"id": "abc", "status": "failed", "message": "boom"})
+    assert job.id == "abc"
+    assert job.status == "failed"
+    assert job.message == "boom"
+
+
+def test_job_accepts_api_keys_and_validates_status():
+    job = Job(jobId="abc", jobStatus="pending", resultUrl="/r")
+    assert (job.id, job.status, job.result_url) == ("abc", "pending", "/r")
+    assert Job.model_validate(job.model_dump(by_alias=True)) == job
+    assert Job.model_validate(job.model_dump()) == job
+    with pytest.raises(ValueError):
+        Job(id="abc", status="running")
+    with pytest.raises(ValueError):
+        Job(status="pending")
+
+
+def test_job_wait_polls_through_shared_poller():
+    import httpx
+
+    from pulse.core.jobs import JobPoller
+
+    statuses = iter(["pending", "pending", "completed"])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/jobs":
+            return httpx.Response(
+                200,
+                json={"jobId": "j1", "jobStatus": next(statuses), "resultUrl": "/r"},
+            )
+        return httpx.Response(200, json={"ok": True})
+
+    client = httpx.Client(
+        base_url="https://example.com", transport=httpx.MockTransport(handler)
+    )
+    job = Job(id="j1", status="pending", _client=client)
+    assert job.wait() == {"ok": True}
+    assert "j1" not in JobPoller.instance()._pending
+
+
+def test_wait_all_polls_jobs_in_shared_rounds():
+    import httpx
+
+    from pulse.core.jobs import wait_all
+
+    polled = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/jobs":
+            job_id = request.url.params["jobId"]
+            polled.append(job_id)
+            status = "completed" if polled.count(job_id) > 1 else "pending"
+            return httpx.Response(
+                200,
+                json={"jobId": job_id, "jobStatus": status, "resultUrl": f"/{job_id}"},
+            )
+        return httpx.Response(200, json={"result": request.url.path})
+
+    client = httpx.Client(
+        base_url="https://example.com", transport=httpx.MockTransport(handler)
+    )
+    jobs = [Job(id=i, status="pending", _client=client) for i in ("a", "b")]
+    assert wait_all(jobs) == [{"result": "/a"}, {"result": "/b"}]
+    # both jobs are refreshed in the same poll rounds, not one after another
+    assert sorted(polled[:2]) == sorted(polled[2:]) == ["a", "b"]
+
+
+def test_job_wait_bytes_returns_raw_result():
+    import httpx
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/jobs":
+            return httpx.Response(
+                200, json={"jobId": "j1", "jobStatus": "completed", "resultUrl": "/r"}
+            )
+        return httpx.Response(200, content=b'{"ok":true}')
+
+    client = httpx.Client(
+        base_url="https://example.com", transport=httpx.MockTransport(handler)
+    )
+    job = Job(id="j1", status="pending", _client=client)
+    assert job.wait_bytes() == b'{"ok":true}'
+
+
+def test_poller_backs_off_between_rounds(monkeypatch):
+    import httpx
+    import random
+    from pulse.core import jobs
+    from pulse.core.jobs import JobPoller, wait_all
+
+    sleeps = []
+    monkeypatch.setattr(jobs, "_sleep", sleeps.append)
+    monkeypatch.setattr(random, "uniform", lambda a, b: 0.0)
+    monkeypatch.setattr(JobPoller, "_instance", JobPoller(interval=0.2))
+    statuses = iter(["pending"] * 5 + ["completed"])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/jobs":
+            return httpx.Response(
+                200,
+                json={"jobId": "j1", "jobStatus": next(statuses), "resultUrl": "/r"},
+            )
+        return httpx.Response(200, json={"ok": True})
+
+    client = httpx.Client(
+        base_url="https://example.com", transport=httpx.MockTransport(handler)
+    )
+    assert wait_all([Job(id="j1", status="pending", _client=client)]) == [{"ok": True}]
+    # sleeps after the final round may not have happened yet
+    assert sleeps[:5] == pytest.approx([0.05, 0.085, 0.1445, 0.2, 0.2])
+
+
+def test_wait_async_polls_jobs_concurrently(monkeypatch):
+    import asyncio
+
+    import httpx
+
+    from pulse.core import jobs
+
+    monkeypatch.setattr(jobs, "_POLL_INITIAL_INTERVAL", 0.0)
+    polled = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/jobs":
+            job_id = request.url.params["jobId"]
+            polled.append(job_id)
+            status = "completed" if polled.count(job_id) > 1 else "pending"
+            return httpx.Response(
+                200,
+                json={"jobId": job_id, "jobStatus": status, "resultUrl": f"/{job_id}"},
+            )
+        return httpx.Response(200, json={"result": request.url.path})
+
+    async def main():
+        async with httpx.AsyncClient(
+            base_url="https://example.com", transport=httpx.MockTransport(handler)
+        ) as client:
+            return await asyncio.gather(
+                Job(id="a", status="pending").wait_async(client),
+                Job(id="b", status="pending").wait_async(client),
+            )
+
+    assert asyncio.run(main()) == [{"result": "/a"}, {"result": "/b"}]
+    assert sorted(polled[:2]) == ["a", "b"]
+
+
+def test_wait_many_downloads_results_concurrently():
+    import threading
+
+    import httpx
+
+    from pulse.core.jobs import JobPoller
+
+    # each result download blocks until the other one is in flight too
+    barrier = threading.Barrier(2, timeout=5)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/jobs":
+            job_id = request.url.params["jobId"]
+            return httpx.Response(
+                200,
+                json={
+                    "jobId": job_id,
+                    "jobStatus": "completed",
+                    "resultUrl": f"/{job_id}",
+                },
+            )
+        barrier.wait()
+        return httpx.Response(200, json={"result": request.url.path})
+
+    client = httpx.Client(
+        base_url="https://example.com", transport=httpx.MockTransport(handler)
+    )
+    jobs = [Job(id=i, status="pending", _client=client) for i in ("a", "b")]
+    assert Job.wait_many(jobs) == [{"result": "/a"}, {"result": "/b"}]
+    # later rounds and downloads reuse the poller's worker pool
+    executor = JobPoller.instance()._executor
+    assert executor is not None
+    assert Job.wait_many(jobs) == [{"result": "/a"}, {"result": "/b"}]
+    assert JobPoller.instance()._executor is executor
+
+
+def test_waiters_on_the_same_job_share_its_state():
+    import threading
+
+    import httpx
+
+    from pulse.core.jobs import JobPoller, wait_all
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/jobs":
+            return httpx.Response(
+                200, json={"jobId": "j1", "jobStatus": "completed", "resultUrl": "/r"}
+            )
+        return httpx.Response(200, json={"ok": True})
+
+    client = httpx.Client(
+        base_url="https://example.com", transport=httpx.MockTransport(handler)
+    )
+    job = Job(id="j1", status="pending", _client=client)
+    assert wait_all([job, job], timeout=1) == [{"ok": True}, {"ok": True}]
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(job.wait(timeout=1)))
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [{"ok": True}, {"ok": True}]
+    assert "j1" not in JobPoller.instance()._pending
+
+
+def test_missing_job_is_retried_between_rounds_not_inline(monkeypatch):
+    import threading
+
+    import httpx
+
+    from pulse.core import jobs
+    from pulse.core.exceptions import PulseAPIError
+    from pulse.core.jobs import JobPoller
+
+    def no_inline_refresh(self, *args, **kwargs):
+        raise AssertionError("poller must not call the blocking Job.refresh")
+
+    monkeypatch.setattr(Job, "refresh", no_inline_refresh)
+    polled = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/jobs":
+            job_id = request.url.params["jobId"]
+            polled.append(job_id)
+            if job_id == "missing":
+                return httpx.Response(404, json={"error": "not found"})
+            return httpx.Response(
+                200, json={"jobId": job_id, "jobStatus": "completed", "resultUrl": "/r"}
+            )
+        return httpx.Response(200, json={"ok": True})
+
+    client = httpx.Client(
+        base_url="https://example.com", transport=httpx.MockTransport(handler)
+    )
+    found = Job(id="found", status="pending", _client=client)
+    missing = Job(id="missing", status="pending", _client=client)
+
+    # a long retry delay parks the missing job without stalling the other one;
+    # the delay counts the poller's own (here skipped) pauses, so the missing
+    # job is retried on the next rounds, each pausing once for the whole
+    # delay rather than spinning until the wall clock catches up, then failed
+    pauses = []
+    monkeypatch.setattr(jobs, "_sleep", pauses.append)
+    monkeypatch.setattr(
+        JobPoller, "_instance", JobPoller(max_retries=3, retry_delay=60.0)
+    )
+    errors = []
+
+    def wait_missing():
+        try:
+            missing.wait(timeout=1)
+        except PulseAPIError as exc:
+            errors.append(exc)
+
+    waiter = threading.Thread(target=wait_missing)
+    waiter.start()
+    assert found.wait(timeout=1) == {"ok": True}
+    waiter.join()
+    assert len(errors) == 1
+    assert polled.count("found") == 1
+    assert polled.count("missing") == 3
+    assert sum(pause >= 60.0 for pause in pauses) == 2
+    assert len(pauses) <= 5
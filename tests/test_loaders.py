@@ -0,0 +1,37 @@
+"""Tests for the file loaders behind the starter helpers."""
+
+import os
+
+from pulse._loaders import get_strings
+
+
+def test_get_strings_from_list_is_passthrough():
+    data = ["a", "b"]
+    assert get_strings(data) is data
+
+
+def test_get_strings_txt_cache_invalidates_on_edit(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("one\n\n two \n", encoding="utf-8")
+    first = get_strings(str(path))
+    assert first == ["one", "two"]
+    # returned lists are copies of the cached entry
+    first.append("mutated")
+    assert get_strings(str(path)) == ["one", "two"]
+
+    path.write_text("three\n", encoding="utf-8")
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert get_strings(str(path)) == ["three"]
+
+
+def test_get_strings_csv_first_column(tmp_path):
+    path = tmp_path / "input.csv"
+    path.write_text("hello,1\nworld,2\n", encoding="utf-8")
+    assert get_strings(str(path)) == ["hello", "world"]
+
+
+def test_get_strings_tsv_skips_empty_cells(tmp_path):
+    path = tmp_path / "input.tsv"
+    path.write_text("hello\t1\n\t2\n42\t3\n", encoding="utf-8")
+    assert get_strings(str(path)) == ["hello", "42"]
@@ -0,0 +1,66 @@
+"""Unit tests for the Pulse API response models."""
+
+import numpy as np
+
+from pulse.core.models import EmbeddingsResponse
+
+
+def test_embeddings_vectors_are_one_cached_float32_array():
+    resp = EmbeddingsResponse.model_validate_json(
+        b'{"embeddings":[{"text":"a","vector":[1,2]},{"text":"b","vector":[3,4]}]}'
+    )
+    vectors = resp.vectors
+    assert vectors.dtype == np.float32
+    assert vectors.flags["C_CONTIGUOUS"]
+    np.testing.assert_array_equal(vectors, [[1, 2], [3, 4]])
+    assert resp.vectors is vectors
+    assert "vectors" not in resp.model_dump()
+
+
+def test_embeddings_vectors_empty():
+    assert EmbeddingsResponse(embeddings=[]).vectors.shape == (0, 0)
+
+
+def test_similarity_array_matches_nested_lists():
+    from pulse.core.models import SimilarityResponse
+
+    for resp in (
+        SimilarityResponse(
+            scenario="self", mode="flattened", n=3, flattened=[0.2, 0.3, 0.4]
+        ),
+        SimilarityResponse(
+            scenario="cross", mode="flattened", n=2, flattened=[1, 2, 3, 4, 5, 6]
+        ),
+        SimilarityResponse(
+            scenario="cross", mode="matrix", n=1, flattened=[], matrix=[[0.5, 0.6]]
+        ),
+    ):
+        arr = resp.array
+        assert arr.dtype == np.float32
+        np.testing.assert_allclose(arr, resp.similarity, rtol=1e-6)
+        assert resp.array is arr
+
+
+def test_numeric_payloads_are_not_validated_per_element():
+    from pulse.core.models import EmbeddingDocument, SimilarityResponse
+
+    vector = [0.1, 0.2]
+    assert EmbeddingDocument(text="a", vector=vector).vector is vector
+    flat = [0.2, 0.3, 0.4]
+    resp = SimilarityResponse(scenario="self", mode="flattened", n=3, flattened=flat)
+    assert resp.flattened is flat
+
+
+def test_to_numpy_converts_to_requested_dtype():
+    from pulse.core.models import SimilarityResponse
+
+    emb = EmbeddingsResponse(embeddings=[{"text": "a", "vector": [0.5, 0.25]}])
+    assert emb.to_numpy() is emb.vectors
+    half = emb.to_numpy(np.float16)
+    assert half.dtype == np.float16
+    np.testing.assert_array_equal(half, [[0.5, 0.25]])
+
+    sim = SimilarityResponse(scenario="self", mode="flattened", n=2, flattened=[0.5])
+    assert sim.to_numpy() is sim.array
+    np.testing.assert_array_equal(sim.to_numpy("float16"), [[1, 0.5], [0.5, 1]])
+    assert sim.to_numpy("float16").dtype == np.float16
@@ -147,6 +147,22 @@ def test_theme_allocation_with_similarity():
     assert multi["theme_2"].tolist() == ["C", "A"]
 
 
+def test_theme_allocation_with_ndarray_similarity():
+    import numpy as np
+    from pulse.analysis.results import ThemeAllocationResult
+
+    sim = np.array([[0.1, 0.7], [0.4, 0.2]], dtype=np.float32)
+    result = ThemeAllocationResult(
+        ["d1", "d2"], ["A", "B"], [1, 0], threshold=0.7, similarity=sim
+    )
+    # a float32 score equal to the threshold is still assigned
+    single = result.assign_single()
+    assert single.iloc[0] == "B"
+    assert single.isna().iloc[1]
+    df = result.to_dataframe()
+    assert isinstance(df["score"].iloc[1], float)
+
+
 def test_cluster_result_methods():
     texts = ["a", "b", "c"]
     # simple similarity matrix (identity-like)
@@ -177,3 +193,122 @@ def test_cluster_result_methods():
     # Remove empty labels
     xticks = [lbl for lbl in xticks if lbl]
     assert set(xticks) == set(texts)
+
+
+def test_theme_allocation_multi_uses_precomputed_top_k():
+    import numpy as np
+    from pulse.analysis.processes import _top_k_indices
+    from pulse.analysis.results import ThemeAllocationResult
+
+    sim = np.array([[0.1, 0.9, 0.5, 0.3], [0.8, 0.2, 0.4, 0.6]], dtype=np.float32)
+    top = _top_k_indices(sim, 2)
+    assert top.tolist() == [[1, 2], [0, 3]]
+
+    result = ThemeAllocationResult(
+        ["d1", "d2"],
+        ["A", "B", "C", "D"],
+        [1, 0],
+        single_label=False,
+        similarity=sim,
+        top_k_indices=top,
+    )
+    multi = result.assign_multi(k=2)
+    assert multi["theme_1"].tolist() == ["B", "A"]
+    assert multi["theme_2"].tolist() == ["C", "D"]
+    # wider requests fall back to ranking the full matrix
+    assert result.assign_multi()["theme_4"].tolist() == ["A", "B"]
+
+
+def test_cluster_result_float32_and_cached_condensed():
+    import numpy as np
+    from pulse.analysis.results import ClusterResult
+
+    matrix = [[1.0, 0.1, 0.2], [0.1, 1.0, 0.3], [0.2, 0.3, 1.0]]
+    result = ClusterResult(matrix, ["a", "b", "c"])
+    assert result.matrix.dtype == np.float32
+
+    result.dendrogram()
+    condensed = result._condensed
+    assert condensed.shape == (3,)
+    np.testing.assert_allclose(condensed, [0.9, 0.8, 0.7], rtol=1e-6)
+    result.dendrogram()
+    assert result._condensed is condensed
+
+
+def test_theme_extraction_to_dataframe():
+    from pulse.analysis.results import ThemeExtractionResult
+    from pulse.core.models import ExtractionsResponse
+
+    response = ExtractionsResponse(
+        extractions=[[["x", "y"], []], [["z"], ["w"]], [["ignored"]]]
+    )
+    df = ThemeExtractionResult(response, ["t1", "t2"], ["A", "B"]).to_dataframe()
+    assert df.to_dict("records") == [
+        {"text": "t1", "theme": "A", "extraction": "x"},
+        {"text": "t1", "theme": "A", "extraction": "y"},
+        {"text": "t2", "theme": "A", "extraction": "z"},
+        {"text": "t2", "theme": "B", "extraction": "w"},
+    ]
+
+
+def test_theme_allocation_bar_chart_counts_assigned_themes():
+    from pulse.analysis.results import ThemeAllocationResult
+
+    result = ThemeAllocationResult(
+        ["d1", "d2", "d3"],
+        ["A", "B", "C"],
+        [2, 0, 2],
+        similarity=[[0.1, 0.2, 0.9], [0.9, 0.1, 0.1], [0.2, 0.1, 0.8]],
+    )
+    ax = result.bar_chart()
+    assert [t.get_text() for t in ax.get_yticklabels()] == ["A", "C"]
+    assert [bar.get_width() for bar in ax.patches] == [1, 2]
+
+
+def test_to_dataframe_is_cached_and_copied():
+    from pulse.analysis.results import SentimentResult
+    from pulse.core.models import SentimentResponse
+
+    result = SentimentResult(
+        SentimentResponse(results=[{"sentiment": "positive", "confidence": 0.9}]),
+        ["a"],
+    )
+    first = result.to_dataframe()
+    first.loc[0, "sentiment"] = "changed"
+    assert result.to_dataframe().loc[0, "sentiment"] == "positive"
+    assert result._df is not None
+
+
+def test_cluster_scatter_caches_coords_and_limits_annotations():
+    import numpy as np
+    from pulse.analysis.results import ClusterResult
+
+    rng = np.random.default_rng(0)
+    points = rng.random((8, 3))
+    matrix = points @ points.T
+    result = ClusterResult(matrix, [f"t{i}" for i in range(8)])
+
+    ax = result.plot_scatter(max_annotations=3)
+    assert len(ax.texts) == 3
+    coords = result._coords
+    result.plot_scatter()
+    assert result._coords is coords
+
+
+def test_theme_allocation_keeps_api_scores_and_tolerates_ragged_rows():
+    from pulse.analysis.results import ThemeAllocationResult
+
+    # the last text has one score missing and one given as None
+    sim = [[0.1, 0.8, 0.3], [0.5, 0.2, 0.7], [0.9, None]]
+    result = ThemeAllocationResult(
+        ["d1", "d2", "d3"], ["A", "B", "C"], [1, 2, 0], threshold=0.6, similarity=sim
+    )
+    assert result.assign_single().tolist() == ["B", "C", "A"]
+    multi = result.assign_multi(k=3)
+    assert multi["theme_1"].iloc[2] == "A"
+    assert multi.iloc[2, 1:].isna().all()
+    df = result.to_dataframe()
+    # scores are the API's values, not float32 approximations
+    assert df["score"].iloc[0] == 0.1
+    assert df["score"].iloc[6] == 0.9
+    assert df["score"].iloc[7:].isna().all()
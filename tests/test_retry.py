@@ -0,0 +1,102 @@
+"""Unit tests for the throttling-aware retry clients."""
+
+import asyncio
+
+import httpx
+
+from pulse.core import retry
+from pulse.core.retry import AsyncRetryClient, RetryClient
+
+
+def _throttled_then_ok(calls):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.content)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "2"})
+        if len(calls) == 2:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"ok": True})
+
+    return handler
+
+
+def test_retries_throttled_requests_honoring_retry_after(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(retry.time, "sleep", sleeps.append)
+    calls = []
+    transport = httpx.MockTransport(_throttled_then_ok(calls))
+    with RetryClient(transport=transport, base_url="https://example.com") as client:
+        response = client.post("/embeddings", content=b'{"inputs":["a"]}')
+    assert response.json() == {"ok": True}
+    assert calls == [b'{"inputs":["a"]}'] * 3
+    assert sleeps == [2.0, 1.0]
+
+
+def test_gives_up_after_max_retries(monkeypatch):
+    monkeypatch.setattr(retry.time, "sleep", lambda _: None)
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(429)
+
+    with RetryClient(
+        transport=httpx.MockTransport(handler),
+        base_url="https://example.com",
+        max_retries=2,
+    ) as client:
+        assert client.get("/jobs").status_code == 429
+    assert len(calls) == 3
+
+
+def test_async_retries_throttled_requests(monkeypatch):
+    async def no_sleep(_):
+        pass
+
+    monkeypatch.setattr(retry.asyncio, "sleep", no_sleep)
+    calls = []
+    transport = httpx.MockTransport(_throttled_then_ok(calls))
+
+    async def run():
+        async with AsyncRetryClient(
+            transport=transport, base_url="https://example.com"
+        ) as client:
+            return await client.post("/sentiment", content=b"{}")
+
+    assert asyncio.run(run()).status_code == 200
+    assert len(calls) == 3
+
+
+def test_retries_connect_errors(monkeypatch):
+    monkeypatch.setattr(retry.time, "sleep", lambda _: None)
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200)
+
+    with RetryClient(
+        transport=httpx.MockTransport(handler), base_url="https://example.com"
+    ) as client:
+        assert client.get("/jobs").status_code == 200
+    assert len(calls) == 2
+
+
+def test_default_clients_honor_environment_proxies(monkeypatch):
+    from pulse.core.async_client import AsyncCoreClient
+    from pulse.core.client import CoreClient
+
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+    url = httpx.URL("https://dev.core.researchwiseai.com/pulse/v1/embeddings")
+    auth = httpx.BasicAuth("user", "pass")
+
+    client = CoreClient(auth=auth).client
+    # requests go through a proxy mount, not the direct transport
+    assert client._transport_for_url(url) is not client._transport
+    client.close()
+
+    async_client = AsyncCoreClient(auth=auth).client
+    assert async_client._transport_for_url(url) is not async_client._transport
+    asyncio.run(async_client.aclose())
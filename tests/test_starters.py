@@ -32,22 +32,6 @@ reviews = [
 ]
 
 
-@pytest.fixture(autouse=True)
-def disable_sleep(monkeypatch, request):
-    """Disable sleep during playback (cassette exists), skip when recording."""
-    import time
-    import os
-
-    # Determine cassette path for this test
-    cassette_dir = os.path.join(os.path.dirname(request.node.fspath), "cassettes")
-    cassette_file = os.path.join(cassette_dir, f"{request.node.name}.yaml")
-    # If cassette not present, assume recording mode and allow real sleep
-    if not os.path.exists(cassette_file):
-        return
-    # In playback mode, disable real sleep to speed up tests
-    monkeypatch.setattr(time, "sleep", lambda x: None)
-
-
 base_url = "https://dev.core.researchwiseai.com/pulse/v1"
 
 # Load credentials from environment variables